@@ -0,0 +1,36 @@
+"""Eager compilation of the backtest kernel.
+
+The kernel is decorated with ``@njit(cache=True)``, so compiled machine
+code persists in numba's on-disk cache and the 1-3s JIT cost is only ever
+paid by the first process on a given machine. For interactive sessions
+where even that one hit matters, ``precompile()`` triggers compilation up
+front on a tiny representative input instead of in the middle of the
+first real backtest.
+
+An AOT build via ``numba.pycc`` was considered and rejected: pycc is
+deprecated upstream, requires a C toolchain at install time, and its
+signature strings do not express the kernel's mixed-dtype tuple return.
+"""
+
+import numpy as np
+
+from bot.backtest.engine import _run_backtest_kernel
+from bot.utils._njit import HAVE_NUMBA
+
+
+def precompile() -> bool:
+    """Compile the backtest kernel ahead of first use.
+
+    Returns:
+        True if a JIT compile was triggered (or found in cache),
+        False when numba is not installed and the kernel runs as
+        plain Python.
+    """
+    if not HAVE_NUMBA:
+        return False
+
+    closes = np.ones(2, dtype=np.float64)
+    signal_types = np.zeros(2, dtype=np.int8)
+    side_signs = np.zeros(2, dtype=np.int8)
+    _run_backtest_kernel(closes, signal_types, side_signs, 0, 1.0, 0.0, 0.0)
+    return True
@@ -1,25 +1,158 @@
 """Backtesting engine."""
 
 import asyncio
+import logging
+from collections.abc import Sequence
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 import pandas as pd
 import numpy as np
 
 from bot.core.models import (
-    MarketData, Trade, Order, OrderStatus, 
-    OrderType, Side, BacktestResult, Position
+    MarketData, Trade, Side, BacktestResult, Position
 )
 from bot.core.logger import get_logger
 from bot.core.exceptions import BacktestError
+from bot.utils._njit import njit
+
+
+@njit(cache=True)
+def _run_backtest_kernel(closes, signal_types, side_signs, min_periods,
+                         initial_capital, commission, slippage):
+    """JIT-compiled per-bar position state machine.
+
+    Consumes pre-materialized signal arrays (0=hold, 1=entry, 2=exit and
+    +1/-1 side signs) and returns the closed trades as parallel arrays:
+    (entry_bars, exit_bars, trade_sides, quantities, entry_prices,
+    exit_prices, pnls, commissions, entry_capitals, exit_capitals),
+    plus the final capital.
+    """
+    n = closes.shape[0]
+    entry_bars = np.empty(n, dtype=np.int64)
+    exit_bars = np.empty(n, dtype=np.int64)
+    trade_sides = np.empty(n, dtype=np.int8)
+    quantities = np.empty(n, dtype=np.float64)
+    entry_prices = np.empty(n, dtype=np.float64)
+    exit_prices = np.empty(n, dtype=np.float64)
+    pnls = np.empty(n, dtype=np.float64)
+    commissions = np.empty(n, dtype=np.float64)
+    entry_capitals = np.empty(n, dtype=np.float64)
+    exit_capitals = np.empty(n, dtype=np.float64)
+
+    capital = initial_capital
+    pos_side = 0  # 0 = flat, +1 = long, -1 = short
+    pos_qty = 0.0
+    pos_entry = 0.0
+    entry_bar = -1
+    ntrades = 0
+
+    for i in range(min_periods, n):
+        st = signal_types[i]
+        if st == 1:
+            if pos_side == 0:
+                side = side_signs[i]
+                price = closes[i]
+                # Fixed 10% of capital per position
+                position_size = capital * 0.1
+                capital -= position_size * commission
+                pos_qty = position_size / price
+                # Signed side makes slippage and PnL branchless: +1 pays up
+                # on entry/down on exit, -1 the reverse
+                pos_entry = price * (1.0 + side * slippage)
+                pos_side = side
+                entry_bar = i
+        elif st == 2:
+            if pos_side != 0 and side_signs[i] == pos_side:
+                exec_price = closes[i] * (1.0 - pos_side * slippage)
+                pnl = pos_side * (exec_price - pos_entry) * pos_qty
+                comm = pos_qty * exec_price * commission
+                entry_bars[ntrades] = entry_bar
+                exit_bars[ntrades] = i
+                trade_sides[ntrades] = pos_side
+                quantities[ntrades] = pos_qty
+                entry_prices[ntrades] = pos_entry
+                exit_prices[ntrades] = exec_price
+                pnls[ntrades] = pnl
+                commissions[ntrades] = comm
+                entry_capitals[ntrades] = capital
+                capital += pnl - comm
+                exit_capitals[ntrades] = capital
+                ntrades += 1
+                pos_side = 0
+
+    # Force-close any open position at the final bar
+    if pos_side != 0:
+        i = n - 1
+        exec_price = closes[i] * (1.0 - pos_side * slippage)
+        pnl = pos_side * (exec_price - pos_entry) * pos_qty
+        comm = pos_qty * exec_price * commission
+        entry_bars[ntrades] = entry_bar
+        exit_bars[ntrades] = i
+        trade_sides[ntrades] = pos_side
+        quantities[ntrades] = pos_qty
+        entry_prices[ntrades] = pos_entry
+        exit_prices[ntrades] = exec_price
+        pnls[ntrades] = pnl
+        commissions[ntrades] = comm
+        entry_capitals[ntrades] = capital
+        capital += pnl - comm
+        exit_capitals[ntrades] = capital
+        ntrades += 1
+
+    return (entry_bars[:ntrades], exit_bars[:ntrades], trade_sides[:ntrades],
+            quantities[:ntrades], entry_prices[:ntrades], exit_prices[:ntrades],
+            pnls[:ntrades], commissions[:ntrades],
+            entry_capitals[:ntrades], exit_capitals[:ntrades], capital)
+
+
+class _LazyTradeView(Sequence):
+    """Sequence of Trade objects materialized on demand from kernel arrays.
+
+    The kernel reports closed trades as parallel arrays; consumers that
+    only read summary statistics never pay for building Trade dataclasses.
+    Each element is constructed (and cached) the first time it is accessed.
+    """
+
+    def __init__(self, kernel_out: tuple, market_data: List[MarketData], symbol: str):
+        (self._entry_bars, self._exit_bars, self._sides, self._quantities,
+         self._entry_prices, self._exit_prices, self._pnls,
+         self._commissions, _, _, _) = kernel_out
+        self._market_data = market_data
+        self._symbol = symbol
+        self._cache: List[Optional[Trade]] = [None] * len(self._exit_bars)
+
+    def __len__(self) -> int:
+        return len(self._exit_bars)
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            # Match list semantics: slicing returns a list of Trades
+            return [self[i] for i in range(*k.indices(len(self._cache)))]
+        if k < 0:
+            k += len(self._cache)
+        trade = self._cache[k]
+        if trade is None:
+            trade = Trade(
+                id=f"trade_{k + 1}",
+                order_id=f"order_{k + 1}",
+                symbol=self._symbol,
+                side=Side.BUY if self._sides[k] > 0 else Side.SELL,
+                quantity=float(self._quantities[k]),
+                price=float(self._exit_prices[k]),
+                timestamp=self._market_data[int(self._exit_bars[k])].timestamp,
+                commission=float(self._commissions[k]),
+                realized_pnl=float(self._pnls[k])
+            )
+            self._cache[k] = trade
+        return trade
 
 
 class BacktestEngine:
     """Backtesting engine for strategy testing."""
-    
+
     def __init__(self, config: Dict[str, Any]):
         """Initialize backtest engine.
-        
+
         Args:
             config: Backtest configuration
         """
@@ -28,17 +161,61 @@ class BacktestEngine:
         self.initial_capital = config.get('initial_capital', 10000.0)
         self.commission = config.get('commission', 0.001)
         self.slippage = config.get('slippage', 0.001)
-        
-        # Backtest state
+
+        # Backtest state. Single-symbol backtests are the only supported
+        # shape, so the open position is one optional field rather than a
+        # symbol-keyed dict paying a hash lookup per access.
         self.capital = self.initial_capital
-        self.positions: Dict[str, Position] = {}
-        self.trades: List[Trade] = []
-        self.orders: List[Order] = []
-        self.equity_curve: List[float] = []
-        self.drawdown_curve: List[float] = []
+        self._position: Optional[Position] = None
+        self.trades: Sequence[Trade] = []
+        self.equity_curve: np.ndarray = np.empty(0)
+        self.drawdown_curve: np.ndarray = np.empty(0)
         self.max_equity = self.initial_capital
         self.max_drawdown = 0.0
-    
+
+        # SoA views of the market data, populated by run_backtest
+        self.closes: Optional[np.ndarray] = None
+        self.timestamps: Optional[np.ndarray] = None
+
+        # Closed trade segments as (entry_bar, exit_bar, side_sign, quantity,
+        # entry_price, capital_at_entry, capital_at_exit) tuples, used to
+        # reconstruct the equity curve vectorially after the main loop.
+        self._segments: List[tuple] = []
+
+        # Realized PnL per closed trade, kept as a parallel float64 array so
+        # result aggregation is a couple of masked reductions.
+        self._trade_pnls: np.ndarray = np.empty(0)
+
+    @property
+    def positions(self) -> Dict[str, Position]:
+        """Open positions as a symbol-keyed dict, for external callers."""
+        if self._position is None:
+            return {}
+        return {self._position.symbol: self._position}
+
+    @staticmethod
+    def _to_arrays(market_data: List[MarketData]) -> Dict[str, np.ndarray]:
+        """Unpack market data into struct-of-arrays NumPy columns.
+
+        Args:
+            market_data: Historical market data
+
+        Returns:
+            Dict of float64 OHLCV arrays plus int64 ns timestamps
+        """
+        n = len(market_data)
+        return {
+            'open': np.fromiter((md.open for md in market_data), dtype=np.float64, count=n),
+            'high': np.fromiter((md.high for md in market_data), dtype=np.float64, count=n),
+            'low': np.fromiter((md.low for md in market_data), dtype=np.float64, count=n),
+            'close': np.fromiter((md.close for md in market_data), dtype=np.float64, count=n),
+            'volume': np.fromiter((md.volume for md in market_data), dtype=np.float64, count=n),
+            'ts': np.fromiter(
+                (int(md.timestamp.timestamp() * 1e9) for md in market_data),
+                dtype=np.int64, count=n
+            ),
+        }
+
     async def run_backtest(
         self,
         strategy,
@@ -46,248 +223,190 @@ class BacktestEngine:
         symbol: str
     ) -> BacktestResult:
         """Run backtest on strategy.
-        
+
         Args:
             strategy: Trading strategy
             market_data: Historical market data
             symbol: Trading symbol
-            
+
         Returns:
             BacktestResult
         """
         self.logger.info(f"Starting backtest for {symbol}")
         self.logger.info(f"Initial capital: ${self.initial_capital:,.2f}")
-        
+
         # Reset state
         self.capital = self.initial_capital
-        self.positions.clear()
-        self.trades.clear()
-        self.orders.clear()
-        self.equity_curve = []
-        self.drawdown_curve = []
+        self._position = None
+        self.trades = []
+        self.equity_curve = np.empty(0)
+        self.drawdown_curve = np.empty(0)
         self.max_equity = self.initial_capital
         self.max_drawdown = 0.0
-        
-        # Process market data
+        self._segments = []
+        self._trade_pnls = np.empty(0)
+
+        # Unpack market data into SoA arrays once; the hot loop below only
+        # touches contiguous float64 columns instead of per-bar dataclasses.
+        arrays = self._to_arrays(market_data)
+        closes = arrays['close']
+        self.closes = closes
+        self.timestamps = arrays['ts']
+
+        n = len(market_data)
         min_periods = strategy.get_min_periods() if hasattr(strategy, 'get_min_periods') else 100
-        
-        for i in range(min_periods, len(market_data)):
-            # Get data window
-            data_window = market_data[max(0, i - min_periods):i]
-            current_candle = market_data[i]
-            current_price = current_candle.close
-            
-            # Update equity
-            self._update_equity(current_price, symbol)
-            
-            # Generate signal
+
+        # Pre-materialize signals into arrays; the JIT kernel cannot await
+        # the (async) strategy, so signal generation stays in Python.
+        signal_types = np.zeros(n, dtype=np.int8)
+        side_signs = np.zeros(n, dtype=np.int8)
+
+        # Bind the strategy method once; the loop body should only pay for
+        # the call itself, not per-bar attribute lookups
+        generate_signal = strategy.generate_signal
+
+        signal_errors = 0
+        for i in range(min_periods, n):
+            # Strategies take a List[MarketData] window (see StrategyBase);
+            # the float64 columns stay internal to the engine
             try:
-                signal = await strategy.generate_signal(data_window, current_price)
-                if signal:
-                    self._execute_signal(signal, current_price, current_candle.timestamp, symbol)
+                signal = await generate_signal(market_data[i - min_periods:i], float(closes[i]))
             except Exception as e:
+                signal_errors += 1
                 self.logger.error(f"Error generating signal: {e}")
-        
-        # Close any open positions
-        self._close_all_positions(market_data[-1].close, market_data[-1].timestamp, symbol)
-        
+                continue
+
+            if not signal or signal.signal_type == 'hold':
+                continue
+
+            signal_types[i] = 1 if signal.signal_type == 'entry' else 2
+            side_signs[i] = 1 if signal.side == Side.BUY else -1
+
+        # A strategy that errors on every single bar is broken, not noisy;
+        # surface it instead of reporting a clean zero-trade result
+        if signal_errors and signal_errors == n - min_periods:
+            raise BacktestError(
+                f"Signal generation failed on all {signal_errors} bars; "
+                f"see errors above"
+            )
+
+        # Run the position state machine in the compiled kernel
+        kernel_out = _run_backtest_kernel(
+            closes, signal_types, side_signs, min_periods,
+            self.initial_capital, self.commission, self.slippage
+        )
+        self.capital = float(kernel_out[-1])
+
+        # Materialize trades and segments from the kernel's trade arrays
+        self._materialize_trades(kernel_out, market_data, symbol)
+
+        # Reconstruct equity and drawdown curves in one vectorized pass
+        self._compute_equity_curves(closes, min_periods)
+
         # Calculate results
         result = self._calculate_results(market_data[0].timestamp, market_data[-1].timestamp)
-        
+
         self.logger.info(f"Backtest completed. Final capital: ${result.final_capital:,.2f}")
         self.logger.info(f"Total return: {result.total_return:.2%}")
         self.logger.info(f"Total trades: {result.total_trades}")
         self.logger.info(f"Win rate: {result.win_rate:.2%}")
-        
+
         return result
-    
-    def _execute_signal(
-        self,
-        signal,
-        price: float,
-        timestamp: datetime,
-        symbol: str
-    ) -> None:
-        """Execute trading signal.
-        
-        Args:
-            signal: Trading signal
-            price: Current price
-            timestamp: Current timestamp
-            symbol: Trading symbol
-        """
-        if signal.signal_type == 'hold':
-            return
-        
-        if signal.signal_type == 'entry':
-            self._open_position(signal, price, timestamp, symbol)
-        elif signal.signal_type == 'exit':
-            self._close_position(signal.side, price, timestamp, symbol)
-    
-    def _open_position(
-        self,
-        signal,
-        price: float,
-        timestamp: datetime,
-        symbol: str
-    ) -> None:
-        """Open position.
-        
-        Args:
-            signal: Trading signal
-            price: Current price
-            timestamp: Current timestamp
-            symbol: Trading symbol
-        """
-        # Check if already in position
-        if symbol in self.positions:
-            return
-        
-        # Calculate position size (fixed 10% of capital)
-        position_size = self.capital * 0.1
-        quantity = position_size / price
-        
-        # Apply slippage
-        execution_price = price * (1 + self.slippage) if signal.side == Side.BUY else price * (1 - self.slippage)
-        
-        # Calculate commission
-        commission = position_size * self.commission
-        
-        # Deduct from capital
-        self.capital -= commission
-        
-        # Create position
-        position = Position(
-            symbol=symbol,
-            side=signal.side,
-            quantity=quantity,
-            entry_price=execution_price,
-            current_price=execution_price,
-            timestamp=timestamp,
-            stop_loss=signal.stop_loss,
-            take_profit=signal.take_profit
-        )
-        
-        self.positions[symbol] = position
-        self.logger.info(
-            f"Opened {signal.side.value.upper()} position: "
-            f"{quantity:.4f} {symbol} @ ${execution_price:.2f}"
-        )
-    
-    def _close_position(
-        self,
-        side: Side,
-        price: float,
-        timestamp: datetime,
-        symbol: str
-    ) -> None:
-        """Close position.
-        
-        Args:
-            side: Side to close
-            price: Current price
-            timestamp: Current timestamp
-            symbol: Trading symbol
-        """
-        if symbol not in self.positions:
-            return
-        
-        position = self.positions[symbol]
-        
-        if position.side != side:
-            return
-        
-        # Apply slippage
-        execution_price = price * (1 - self.slippage) if side == Side.BUY else price * (1 + self.slippage)
-        
-        # Calculate PnL
-        if side == Side.BUY:
-            pnl = (execution_price - position.entry_price) * position.quantity
-        else:
-            pnl = (position.entry_price - execution_price) * position.quantity
-        
-        # Calculate commission
-        commission = position.value * self.commission
-        
-        # Update capital
-        self.capital += position.value + pnl - commission
-        
-        # Create trade
-        trade = Trade(
-            id=f"trade_{len(self.trades) + 1}",
-            order_id=f"order_{len(self.trades) + 1}",
-            symbol=symbol,
-            side=side,
-            quantity=position.quantity,
-            price=execution_price,
-            timestamp=timestamp,
-            commission=commission,
-            realized_pnl=pnl
-        )
-        
-        self.trades.append(trade)
-        self.logger.info(
-            f"Closed {side.value.upper()} position: "
-            f"{position.quantity:.4f} {symbol} @ ${execution_price:.2f}, "
-            f"PnL: ${pnl:.2f}"
-        )
-        
-        # Remove position
-        del self.positions[symbol]
-    
-    def _close_all_positions(self, price: float, timestamp: datetime, symbol: str) -> None:
-        """Close all positions.
-        
+
+    def _materialize_trades(self, kernel_out: tuple, market_data: List[MarketData], symbol: str) -> None:
+        """Build Trade objects and equity segments from kernel trade arrays.
+
         Args:
-            price: Current price
-            timestamp: Current timestamp
+            kernel_out: Tuple of trade arrays returned by the kernel
+            market_data: Historical market data (for timestamps)
             symbol: Trading symbol
         """
-        if symbol in self.positions:
-            position = self.positions[symbol]
-            self._close_position(position.side, price, timestamp, symbol)
-    
-    def _update_equity(self, price: float, symbol: str) -> None:
-        """Update equity curve.
-        
+        (entry_bars, exit_bars, trade_sides, quantities, entry_prices,
+         exit_prices, pnls, commissions, entry_capitals, exit_capitals, _) = kernel_out
+
+        self._trade_pnls = np.asarray(pnls, dtype=np.float64)
+
+        # Hoist the level check so disabled INFO logging costs nothing per
+        # trade — no f-string formatting, no handler-chain traversal.
+        info_enabled = self.logger.isEnabledFor(logging.INFO)
+
+        for k in range(len(exit_bars)):
+            quantity = float(quantities[k])
+            entry_price = float(entry_prices[k])
+
+            if info_enabled:
+                side_label = "BUY" if trade_sides[k] > 0 else "SELL"
+                self.logger.info(
+                    f"Opened {side_label} position: "
+                    f"{quantity:.4f} {symbol} @ ${entry_price:.2f}"
+                )
+                self.logger.info(
+                    f"Closed {side_label} position: "
+                    f"{quantity:.4f} {symbol} @ ${float(exit_prices[k]):.2f}, "
+                    f"PnL: ${float(pnls[k]):.2f}"
+                )
+
+            self._segments.append((
+                int(entry_bars[k]), int(exit_bars[k]), int(trade_sides[k]),
+                quantity, entry_price, float(entry_capitals[k]), float(exit_capitals[k])
+            ))
+
+        # Trade dataclasses are only built if someone iterates the result's
+        # trade list; summary stats come straight from the pnl array.
+        self.trades = _LazyTradeView(kernel_out, market_data, symbol)
+
+    def _compute_equity_curves(self, closes: np.ndarray, min_periods: int) -> None:
+        """Compute equity and drawdown curves vectorially from trade segments.
+
+        While flat, equity equals capital; while a position is open, equity
+        is an affine function of price, so each segment is filled with a
+        single vector expression instead of per-bar Python arithmetic.
+
         Args:
-            price: Current price
-            symbol: Trading symbol
+            closes: Close price array
+            min_periods: First bar index covered by the curves
         """
-        equity = self.capital
-        
-        # Add unrealized PnL from open positions
-        if symbol in self.positions:
-            position = self.positions[symbol]
-            position.current_price = price
-            
-            if position.side == Side.BUY:
-                unrealized_pnl = (price - position.entry_price) * position.quantity
-            else:
-                unrealized_pnl = (position.entry_price - price) * position.quantity
-            
-            position.unrealized_pnl = unrealized_pnl
-            equity += position.value + unrealized_pnl
-        
-        self.equity_curve.append(equity)
-        
-        # Update max equity and drawdown
-        if equity > self.max_equity:
-            self.max_equity = equity
+        n = len(closes) - min_periods
+        if n <= 0:
+            self.equity_curve = np.empty(0)
+            self.drawdown_curve = np.empty(0)
             self.max_drawdown = 0.0
-        else:
-            drawdown = (self.max_equity - equity) / self.max_equity
-            self.max_drawdown = max(self.max_drawdown, drawdown)
-        
-        self.drawdown_curve.append(self.max_drawdown)
-    
+            return
+
+        equity = np.empty(n, dtype=np.float64)
+        cursor = 0
+        capital = self.initial_capital
+
+        for entry_bar, exit_bar, side_sign, quantity, entry_price, entry_capital, exit_capital in self._segments:
+            e = entry_bar - min_periods
+            x = exit_bar - min_periods
+            # Flat stretch up to the entry bar
+            equity[cursor:e] = capital
+            # In-position stretch: capital + signed mark-to-market PnL
+            equity[e:x] = entry_capital + side_sign * quantity * (
+                closes[entry_bar:exit_bar] - entry_price
+            )
+            capital = exit_capital
+            cursor = x
+
+        # Trailing flat stretch after the last close
+        equity[cursor:] = capital
+
+        running_max = np.maximum.accumulate(equity)
+        drawdown = (running_max - equity) / running_max
+
+        self.equity_curve = equity
+        self.drawdown_curve = drawdown
+        self.max_equity = float(running_max.max())
+        self.max_drawdown = float(drawdown.max())
+
     def _calculate_results(self, start_date: datetime, end_date: datetime) -> BacktestResult:
         """Calculate backtest results.
-        
+
         Args:
             start_date: Start date
             end_date: End date
-            
+
         Returns:
             BacktestResult
         """
@@ -310,42 +429,42 @@ class BacktestEngine:
                 equity_curve=self.equity_curve,
                 drawdown_curve=self.drawdown_curve
             )
-        
-        winning_trades = [t for t in self.trades if t.realized_pnl > 0]
-        losing_trades = [t for t in self.trades if t.realized_pnl <= 0]
-        
+
+        pnls = self._trade_pnls
+        win_mask = pnls > 0
+        winning_trades = int(win_mask.sum())
+        losing_trades = len(self.trades) - winning_trades
+
         total_return = (self.capital - self.initial_capital) / self.initial_capital
-        win_rate = len(winning_trades) / len(self.trades)
-        
-        gross_profit = sum(t.realized_pnl for t in winning_trades)
-        gross_loss = abs(sum(t.realized_pnl for t in losing_trades))
+        win_rate = winning_trades / len(self.trades)
+
+        gross_profit = float(pnls[win_mask].sum())
+        gross_loss = float(-pnls[~win_mask].sum())
         profit_factor = gross_profit / gross_loss if gross_loss > 0 else float('inf')
-        
+
         # Calculate Sharpe ratio (simplified)
         if len(self.equity_curve) > 1:
-            returns = [
-                (self.equity_curve[i] - self.equity_curve[i-1]) / self.equity_curve[i-1]
-                for i in range(1, len(self.equity_curve))
-            ]
-            avg_return = np.mean(returns)
-            std_return = np.std(returns)
+            ec = np.asarray(self.equity_curve, dtype=np.float64)
+            returns = np.diff(ec) / ec[:-1]
+            avg_return = returns.mean()
+            std_return = returns.std()
             sharpe_ratio = (avg_return / std_return) * np.sqrt(252) if std_return > 0 else 0.0
-            
+
             # Sortino ratio
-            negative_returns = [r for r in returns if r < 0]
-            downside_std = np.std(negative_returns) if negative_returns else 0.0
+            negative_returns = returns[returns < 0]
+            downside_std = negative_returns.std() if negative_returns.size else 0.0
             sortino_ratio = (avg_return / downside_std) * np.sqrt(252) if downside_std > 0 else 0.0
         else:
             sharpe_ratio = 0.0
             sortino_ratio = 0.0
-        
+
         return BacktestResult(
             initial_capital=self.initial_capital,
             final_capital=self.capital,
             total_return=total_return,
             total_trades=len(self.trades),
-            winning_trades=len(winning_trades),
-            losing_trades=len(losing_trades),
+            winning_trades=winning_trades,
+            losing_trades=losing_trades,
             win_rate=win_rate,
             max_drawdown=self.max_drawdown,
             sharpe_ratio=sharpe_ratio,
@@ -356,4 +475,4 @@ class BacktestEngine:
             trades=self.trades,
             equity_curve=self.equity_curve,
             drawdown_curve=self.drawdown_curve
-        )
\ No newline at end of file
+        )
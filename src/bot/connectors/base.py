@@ -1,8 +1,11 @@
 """Base connector class."""
 
+import time
 from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any, List
-from datetime import datetime
+from datetime import datetime, timezone
+
+import numpy as np
 
 from bot.core.models import MarketData
 from bot.core.exceptions import ConnectorError
@@ -22,7 +25,7 @@ class ConnectorBase(ABC):
         self.max_retries: int = config.get('max_retries', 3)
         self._is_connected: bool = False
         self._failure_count: int = 0
-        self._last_update: Optional[datetime] = None
+        self._last_update_ns: Optional[int] = None
     
     @property
     def is_connected(self) -> bool:
@@ -37,7 +40,9 @@ class ConnectorBase(ABC):
     @property
     def last_update(self) -> Optional[datetime]:
         """Get last update timestamp."""
-        return self._last_update
+        if self._last_update_ns is None:
+            return None
+        return datetime.fromtimestamp(self._last_update_ns / 1e9, tz=timezone.utc)
     
     @abstractmethod
     async def connect(self) -> None:
@@ -125,6 +130,38 @@ class ConnectorBase(ABC):
         
         return True
     
+    def validate_market_data_batch(self, data: List[MarketData]) -> List[MarketData]:
+        """Validate a batch of market data in one vectorized pass.
+
+        Builds OHLCV column arrays once and evaluates all range checks as a
+        single boolean mask instead of ~8 Python comparisons per candle.
+
+        Args:
+            data: Market data candles to validate
+
+        Returns:
+            List containing only the valid candles
+        """
+        if not data:
+            return []
+
+        n = len(data)
+        opens = np.fromiter((md.open for md in data), dtype=np.float64, count=n)
+        highs = np.fromiter((md.high for md in data), dtype=np.float64, count=n)
+        lows = np.fromiter((md.low for md in data), dtype=np.float64, count=n)
+        closes = np.fromiter((md.close for md in data), dtype=np.float64, count=n)
+        volumes = np.fromiter((md.volume for md in data), dtype=np.float64, count=n)
+
+        mask = (
+            (opens > 0) & (highs > 0) & (lows > 0) & (closes > 0)
+            & (highs >= lows)
+            & (closes <= highs) & (closes >= lows)
+            & (opens <= highs) & (opens >= lows)
+            & (volumes >= 0)
+        )
+
+        return [md for md, ok in zip(data, mask) if ok and md.symbol]
+
     def _increment_failure(self) -> None:
         """Increment failure count."""
         self._failure_count += 1
@@ -134,5 +171,9 @@ class ConnectorBase(ABC):
         self._failure_count = 0
     
     def _update_last_update(self) -> None:
-        """Update last update timestamp."""
-        self._last_update = datetime.utcnow()
\ No newline at end of file
+        """Update last update timestamp.
+
+        Stores an integer epoch-nanosecond stamp; the datetime object is
+        only built lazily when last_update is read.
+        """
+        self._last_update_ns = time.time_ns()
\ No newline at end of file
@@ -1,9 +1,9 @@
 """Connector manager for failover and aggregation."""
 
 import asyncio
+import time
 from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, timedelta
-import statistics
 
 from bot.connectors.base import ConnectorBase
 from bot.core.models import MarketData
@@ -11,6 +11,32 @@ from bot.core.logger import get_logger
 from bot.core.exceptions import ConnectorError
 
 
+def _median(prices: List[float]) -> float:
+    """Median of a small price list without the statistics module.
+
+    The common case is 1-5 prices, so tiny sizes are special-cased with
+    branch-only compares before falling back to an in-place sort.
+    """
+    n = len(prices)
+    if n == 1:
+        return prices[0]
+    if n == 2:
+        return 0.5 * (prices[0] + prices[1])
+    if n == 3:
+        a, b, c = prices
+        return max(min(a, b), min(max(a, b), c))
+    prices.sort()
+    mid = n // 2
+    if n & 1:
+        return prices[mid]
+    return 0.5 * (prices[mid - 1] + prices[mid])
+
+
+# Health results younger than this are served from cache; probes from
+# monitoring and engine init tend to arrive back to back
+_HEALTH_TTL_S = 1.0
+
+
 class ConnectorManager:
     """Manager for multiple connectors with failover."""
     
@@ -24,53 +50,44 @@ class ConnectorManager:
         self.connectors = connectors
         self.config = config
         self.logger = get_logger("connectors.manager")
-        self.primary_connector = self._find_primary()
-        self.secondary_connector = self._find_secondary()
-        self.fallback_connector = self._find_fallback()
+
+        # Name -> connector lookup built once instead of re-scanning (and
+        # re-lowercasing class names) for each of the three roles
+        self._by_name = {
+            c.__class__.__name__.lower().replace('connector', ''): c
+            for c in connectors if c.enabled
+        }
+        self.primary_connector = self._by_name.get((config.get('primary') or '').lower())
+        self.secondary_connector = self._by_name.get((config.get('secondary') or '').lower())
+        self.fallback_connector = self._by_name.get((config.get('fallback') or '').lower())
+
         self.failover_enabled = config.get('failover_enabled', True)
         self.aggregation_method = config.get('aggregation_method', 'median')
         self._current_connector: Optional[ConnectorBase] = None
-    
-    def _find_primary(self) -> Optional[ConnectorBase]:
-        """Find primary connector."""
-        primary_name = self.config.get('primary')
-        for connector in self.connectors:
-            if connector.enabled and connector.__class__.__name__.lower().replace('connector', '') == primary_name.lower():
-                return connector
-        return None
-    
-    def _find_secondary(self) -> Optional[ConnectorBase]:
-        """Find secondary connector."""
-        secondary_name = self.config.get('secondary')
-        if not secondary_name:
-            return None
-        for connector in self.connectors:
-            if connector.enabled and connector.__class__.__name__.lower().replace('connector', '') == secondary_name.lower():
-                return connector
-        return None
-    
-    def _find_fallback(self) -> Optional[ConnectorBase]:
-        """Find fallback connector."""
-        fallback_name = self.config.get('fallback')
-        if not fallback_name:
-            return None
-        for connector in self.connectors:
-            if connector.enabled and connector.__class__.__name__.lower().replace('connector', '') == fallback_name.lower():
-                return connector
-        return None
-    
+        self._health_cache: Optional[Tuple[float, Dict[str, bool]]] = None
+
+        # Resolve the aggregation method to a callable once; get_price then
+        # skips the per-call string comparison chain
+        self._aggregate = {
+            'median': _median,
+            'mean': lambda prices: sum(prices) / len(prices),
+            'last': lambda prices: prices[-1],
+        }.get(self.aggregation_method, lambda prices: prices[0])
+
     async def connect_all(self) -> None:
-        """Connect all enabled connectors."""
+        """Connect all enabled connectors concurrently."""
         self.logger.info("Connecting all connectors...")
-        for connector in self.connectors:
-            if connector.enabled:
-                try:
-                    await connector.connect()
-                    self.logger.info(f"Connected to {connector.__class__.__name__}")
-                except Exception as e:
-                    self.logger.error(f"Failed to connect to {connector.__class__.__name__}: {e}")
-                    connector.enabled = False
-        
+        enabled = [c for c in self.connectors if c.enabled]
+        results = await asyncio.gather(
+            *(c.connect() for c in enabled), return_exceptions=True
+        )
+        for connector, result in zip(enabled, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Failed to connect to {connector.__class__.__name__}: {result}")
+                connector.enabled = False
+            else:
+                self.logger.info(f"Connected to {connector.__class__.__name__}")
+
         # Set current connector
         if self.primary_connector and self.primary_connector.is_connected:
             self._current_connector = self.primary_connector
@@ -100,36 +117,46 @@ class ConnectorManager:
         Returns:
             Price or None if unavailable
         """
-        # Try to get price from all available connectors
+        # Query all available connectors concurrently; wall time is the
+        # slowest connector instead of the sum of all round trips
+        available = [c for c in self.connectors if c.enabled and c.is_connected]
+        results = await asyncio.gather(
+            *(c.get_price(symbol) for c in available), return_exceptions=True
+        )
+
         prices = []
-        
-        for connector in self.connectors:
-            if not connector.enabled or not connector.is_connected:
-                continue
-            
-            try:
-                price = await connector.get_price(symbol)
-                if price is not None and price > 0:
-                    prices.append(price)
-                    self.logger.debug(f"Price from {connector.__class__.__name__}: {price}")
-            except Exception as e:
-                self.logger.warning(f"Error getting price from {connector.__class__.__name__}: {e}")
+        for connector, result in zip(available, results):
+            if isinstance(result, Exception):
+                self.logger.warning(f"Error getting price from {connector.__class__.__name__}: {result}")
                 connector._increment_failure()
-        
+            elif result is not None and result > 0:
+                prices.append(result)
+                self.logger.debug(f"Price from {connector.__class__.__name__}: {result}")
+
         if not prices:
             self.logger.error("No price data available from any connector")
             return None
         
         # Aggregate prices
-        if self.aggregation_method == 'median':
-            return statistics.median(prices)
-        elif self.aggregation_method == 'mean':
-            return statistics.mean(prices)
-        elif self.aggregation_method == 'last':
-            return prices[-1]
-        else:
-            return prices[0]
-    
+        return self._aggregate(prices)
+
+    async def get_prices(self, symbols: List[str]) -> Dict[str, Optional[float]]:
+        """Get prices for several symbols in one batched call.
+
+        Args:
+            symbols: Trading symbols
+
+        Returns:
+            Mapping of symbol to price (None where unavailable)
+        """
+        results = await asyncio.gather(
+            *(self.get_price(s) for s in symbols), return_exceptions=True
+        )
+        return {
+            symbol: None if isinstance(result, BaseException) else result
+            for symbol, result in zip(symbols, results)
+        }
+
     async def get_market_data(
         self,
         symbol: str,
@@ -163,7 +190,7 @@ class ConnectorManager:
                 data = await connector.get_market_data(symbol, timeframe, limit)
                 if data:
                     # Validate data
-                    valid_data = [md for md in data if connector.validate_market_data(md)]
+                    valid_data = connector.validate_market_data_batch(data)
                     if valid_data:
                         self.logger.info(f"Got {len(valid_data)} candles from {connector.__class__.__name__}")
                         return valid_data
@@ -180,17 +207,22 @@ class ConnectorManager:
         Returns:
             Dictionary mapping connector names to health status
         """
-        results = {}
-        for connector in self.connectors:
-            if connector.enabled:
-                try:
-                    healthy = await connector.health_check()
-                    results[connector.__class__.__name__] = healthy
-                except Exception as e:
-                    self.logger.error(f"Health check failed for {connector.__class__.__name__}: {e}")
-                    results[connector.__class__.__name__] = False
+        now = time.monotonic()
+        if self._health_cache is not None and now - self._health_cache[0] < _HEALTH_TTL_S:
+            return self._health_cache[1]
+
+        enabled = [c for c in self.connectors if c.enabled]
+        checks = await asyncio.gather(
+            *(c.health_check() for c in enabled), return_exceptions=True
+        )
+
+        results = {c.__class__.__name__: False for c in self.connectors}
+        for connector, check in zip(enabled, checks):
+            if isinstance(check, Exception):
+                self.logger.error(f"Health check failed for {connector.__class__.__name__}: {check}")
             else:
-                results[connector.__class__.__name__] = False
+                results[connector.__class__.__name__] = check
+        self._health_cache = (now, results)
         return results
     
     def get_connected_connectors(self) -> List[ConnectorBase]:
@@ -1,9 +1,12 @@
 """Mock connector for testing and demo."""
 
 import asyncio
+import random
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timedelta
 
+import numpy as np
+
 from bot.connectors.base import ConnectorBase
 from bot.core.models import MarketData
 from bot.core.logger import get_logger
@@ -49,7 +52,6 @@ class MockConnector(ConnectorBase):
         
         # Simulate slight price movement
         if symbol in self._prices:
-            import random
             variation = random.uniform(-0.001, 0.001)
             price = self._prices[symbol] * (1 + variation)
             self._prices[symbol] = price  # Update for next call
@@ -72,40 +74,36 @@ class MockConnector(ConnectorBase):
             self.logger.warning("Connector not connected")
             return None
         
-        # Generate synthetic OHLCV data
-        import random
-        
+        # Generate synthetic OHLCV data in one batched RNG pass instead of
+        # five scalar random.uniform calls per bar
+        rng = np.random.default_rng()
+
         base_price = self._prices.get(symbol, 1000.0)
-        data = []
         now = datetime.utcnow()
-        
-        for i in range(limit):
-            timestamp = now - timedelta(hours=limit - i)
-            
-            # Generate realistic price movement
-            noise = random.uniform(-0.02, 0.02)
-            price = base_price * (1 + noise * (i / limit))
-            
-            high = price * random.uniform(1.0, 1.01)
-            low = price * random.uniform(0.99, 1.0)
-            open_price = random.uniform(low, high)
-            close_price = random.uniform(low, high)
-            volume = random.uniform(100, 10000)
-            
-            md = MarketData(
+
+        noise = rng.uniform(-0.02, 0.02, limit)
+        price = base_price * (1 + noise * np.arange(limit) / limit)
+        high = np.round(price * rng.uniform(1.0, 1.01, limit), 2)
+        low = np.round(price * rng.uniform(0.99, 1.0, limit), 2)
+        open_price = np.round(rng.uniform(low, high), 2)
+        close_price = np.round(rng.uniform(low, high), 2)
+        volume = np.round(rng.uniform(100, 10000, limit), 2)
+
+        data = [
+            MarketData(
                 symbol=symbol,
-                timestamp=timestamp,
-                open=round(open_price, 2),
-                high=round(high, 2),
-                low=round(low, 2),
-                close=round(close_price, 2),
-                volume=round(volume, 2),
+                timestamp=now - timedelta(hours=limit - i),
+                open=open_price[i],
+                high=high[i],
+                low=low[i],
+                close=close_price[i],
+                volume=volume[i],
                 timeframe=timeframe,
                 source="mock"
             )
-            
-            data.append(md)
-        
+            for i in range(limit)
+        ]
+
         self._update_last_update()
         self._reset_failure_count()
         return data
\ No newline at end of file
@@ -1,29 +1,62 @@
 """Configuration management using Pydantic."""
 
-from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, Field, field_validator, model_validator
+import asyncio
+import mmap
+import os
+import pickle
+import sys
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Tuple, Literal
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator, model_validator
 from datetime import datetime
 
+import yaml
 
-class ExecutionConfig(BaseModel):
+try:
+    # libyaml C extension: 5-10x faster than the pure-Python loader
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+from bot.utils._json import dumps as _json_dumps, loads as _json_loads
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+
+class _ConfigBase(BaseModel):
+    """Shared settings for all config section models.
+
+    extra='forbid' catches typo'd YAML keys at load time with pydantic's
+    closed-schema fast path, and validate_assignment stays off so reads
+    and the few deliberate runtime mutations (mode, log level from CLI
+    flags) skip the assignment guard.
+    """
+
+    model_config = ConfigDict(
+        extra='forbid',
+        validate_assignment=False,
+        protected_namespaces=(),
+    )
+
+
+class ExecutionConfig(_ConfigBase):
     """Execution configuration."""
     
     initial_capital: float = Field(default=10000.0, gt=0, description="Initial capital for trading")
-    order_type: str = Field(default="market", description="Order type: market or limit")
+    order_type: Literal['market', 'limit'] = Field(default="market", description="Order type: market or limit")
     order_timeout: int = Field(default=60, gt=0, description="Order timeout in seconds")
     slippage_percent: float = Field(default=0.1, ge=0, description="Slippage percentage")
     fees: Dict[str, float] = Field(default_factory=lambda: {"maker": 0.001, "taker": 0.001}, description="Trading fees")
     max_orders_per_minute: int = Field(default=10, gt=0, description="Maximum orders per minute")
+    max_concurrency: int = Field(default=8, gt=0, description="Max assets processed concurrently per tick")
+    history_limit: int = Field(default=10000, gt=0, description="Max signals/orders/trades retained in memory")
+    tick_interval_s: float = Field(default=60.0, gt=0, description="Trading loop tick interval in seconds")
     min_confidence_threshold: float = Field(default=0.6, ge=0, le=1, description="Minimum confidence threshold")
     allow_partial_fills: bool = Field(default=True, description="Allow partial fills")
     
-    @field_validator('order_type')
-    @classmethod
-    def validate_order_type(cls, v):
-        if v not in ['market', 'limit']:
-            raise ValueError('order_type must be either "market" or "limit"')
-        return v
-    
     @field_validator('slippage_percent')
     @classmethod
     def validate_slippage(cls, v):
@@ -32,7 +65,7 @@ class ExecutionConfig(BaseModel):
         return v / 100.0 if v >= 1 else v
 
 
-class BacktestingConfig(BaseModel):
+class BacktestingConfig(_ConfigBase):
     """Backtesting configuration."""
     
     start_date: str = Field(default="2024-01-01", description="Backtest start date (YYYY-MM-DD)")
@@ -51,7 +84,7 @@ class BacktestingConfig(BaseModel):
         return v
 
 
-class APICredentialsConfig(BaseModel):
+class APICredentialsConfig(_ConfigBase):
     """API credentials configuration."""
     
     ccxt: Dict[str, Any] = Field(default_factory=dict, description="CCXT exchange credentials")
@@ -60,7 +93,7 @@ class APICredentialsConfig(BaseModel):
     email: Dict[str, Any] = Field(default_factory=dict, description="Email SMTP settings")
 
 
-class AssetConfig(BaseModel):
+class AssetConfig(_ConfigBase):
     """Asset configuration."""
     
     symbol: str
@@ -70,16 +103,28 @@ class AssetConfig(BaseModel):
     min_trade_size: float = Field(default=0.001, gt=0, description="Minimum trade size")
     max_position_size: float = Field(default=1.0, gt=0, description="Maximum position size")
 
+    @field_validator('symbol', 'exchange', 'type')
+    @classmethod
+    def _intern(cls, v: str) -> str:
+        # Interned strings let hot dict lookups (positions, price caches)
+        # short-circuit on pointer equality
+        return sys.intern(v)
 
-class StrategyConfig(BaseModel):
+
+class StrategyConfig(_ConfigBase):
     """Strategy configuration."""
-    
+
     name: str
     enabled: bool = Field(default=True, description="Whether this strategy is enabled")
     parameters: Dict[str, Any] = Field(default_factory=dict, description="Strategy parameters")
 
+    @field_validator('name')
+    @classmethod
+    def _intern(cls, v: str) -> str:
+        return sys.intern(v)
+
 
-class DataProviderConfig(BaseModel):
+class DataProviderConfig(_ConfigBase):
     """Data provider configuration."""
     
     primary: str = Field(default="mock", description="Primary data provider")
@@ -89,26 +134,36 @@ class DataProviderConfig(BaseModel):
     aggregation_method: str = Field(default="median", description="Price aggregation method")
 
 
-class NotificationConfig(BaseModel):
+class TelegramNotificationConfig(_ConfigBase):
+    """Telegram notification channel configuration."""
+
+    enable_notifications: bool = Field(default=False, description="Enable Telegram notifications")
+    bot_token: str = Field(default="", description="Telegram bot token")
+    chat_id: str = Field(default="", description="Telegram chat ID")
+
+
+class EmailNotificationConfig(_ConfigBase):
+    """Email notification channel configuration."""
+
+    enable_notifications: bool = Field(default=False, description="Enable email notifications")
+    smtp_host: str = Field(default="", description="SMTP server host")
+    smtp_port: int = Field(default=587, description="SMTP server port")
+    username: str = Field(default="", description="SMTP username")
+    password: str = Field(default="", description="SMTP password")
+    from_email: str = Field(default="", description="Sender address")
+    to_email: str = Field(default="", description="Recipient address")
+
+
+class NotificationConfig(_ConfigBase):
     """Notification configuration."""
-    
-    telegram: Dict[str, Any] = Field(default_factory=lambda: {
-        "enable_notifications": False,
-        "bot_token": "",
-        "chat_id": ""
-    })
-    email: Dict[str, Any] = Field(default_factory=lambda: {
-        "enable_notifications": False,
-        "smtp_host": "",
-        "smtp_port": 587,
-        "username": "",
-        "password": "",
-        "from_email": ""
-    })
+
+    telegram: TelegramNotificationConfig = Field(default_factory=TelegramNotificationConfig)
+    email: EmailNotificationConfig = Field(default_factory=EmailNotificationConfig)
     rate_limit: int = Field(default=10, gt=0, description="Max notifications per minute")
+    digest_interval_s: float = Field(default=3600.0, gt=0, description="Sub-threshold signal digest interval in seconds")
 
 
-class LoggingConfig(BaseModel):
+class LoggingConfig(_ConfigBase):
     """Logging configuration."""
     
     level: str = Field(default="INFO", description="Log level")
@@ -117,7 +172,7 @@ class LoggingConfig(BaseModel):
     rotation: bool = Field(default=True, description="Enable log rotation")
 
 
-class StateManagementConfig(BaseModel):
+class StateManagementConfig(_ConfigBase):
     """State management configuration."""
     
     enabled: bool = Field(default=True, description="Enable state persistence")
@@ -126,18 +181,16 @@ class StateManagementConfig(BaseModel):
     max_backups: int = Field(default=10, gt=0, description="Maximum number of state backups")
 
 
-class AIMLConfig(BaseModel):
+class AIMLConfig(_ConfigBase):
     """AI/ML configuration."""
     
     enabled: bool = Field(default=False, description="Enable AI/ML features")
     model_type: str = Field(default="random_forest", description="ML model type")
     retrain_interval: int = Field(default=86400, gt=0, description="Retrain interval in seconds")
     feature_window: int = Field(default=100, gt=0, description="Feature calculation window")
-    
-    model_config = {"protected_namespaces": ()}
 
 
-class NewsSentimentConfig(BaseModel):
+class NewsSentimentConfig(_ConfigBase):
     """News sentiment configuration."""
     
     enabled: bool = Field(default=False, description="Enable news sentiment analysis")
@@ -145,7 +198,7 @@ class NewsSentimentConfig(BaseModel):
     update_interval: int = Field(default=3600, gt=0, description="Update interval in seconds")
 
 
-class MonitoringConfig(BaseModel):
+class MonitoringConfig(_ConfigBase):
     """Monitoring configuration."""
     
     enabled: bool = Field(default=True, description="Enable monitoring")
@@ -153,7 +206,7 @@ class MonitoringConfig(BaseModel):
     metrics_retention: int = Field(default=86400, gt=0, description="Metrics retention in seconds")
 
 
-class AdvancedConfig(BaseModel):
+class AdvancedConfig(_ConfigBase):
     """Advanced configuration."""
     
     max_concurrent_orders: int = Field(default=5, gt=0, description="Maximum concurrent orders")
@@ -163,10 +216,10 @@ class AdvancedConfig(BaseModel):
     use_trailing_stop: bool = Field(default=False, description="Use trailing stop loss")
 
 
-class TradingBotConfig(BaseModel):
+class TradingBotConfig(_ConfigBase):
     """Main trading bot configuration."""
     
-    mode: str = Field(default="dry-run", description="Trading mode: dry-run, backtest, live")
+    mode: Literal['dry-run', 'backtest', 'live'] = Field(default="dry-run", description="Trading mode")
     confirm_live: bool = Field(default=False, description="Confirmation required for live mode")
     api_credentials: APICredentialsConfig = Field(default_factory=APICredentialsConfig)
     assets: List[AssetConfig] = Field(default_factory=list, description="List of assets to trade")
@@ -190,21 +243,129 @@ class TradingBotConfig(BaseModel):
                 'Live mode requires confirm_live=true. '
                 'Set confirm_live: true in config.yaml to enable live trading.'
             )
-        if self.mode not in ['dry-run', 'backtest', 'live']:
-            raise ValueError('mode must be one of: dry-run, backtest, live')
         return self
 
 
-def load_config(config_path: str) -> TradingBotConfig:
-    """Load configuration from YAML file."""
-    import yaml
-    from pathlib import Path
-    
+# Module-level adapter so every load reuses one prebuilt SchemaValidator
+# instead of re-resolving the nested model schema per call.
+_TBC_ADAPTER = TypeAdapter(TradingBotConfig)
+
+# Compiled JSON-Schema prefilter: fastjsonschema generates straight-line
+# code for the schema, so malformed configs are rejected in microseconds
+# before paying for the full Pydantic validation pass.
+if fastjsonschema is not None:
+    _SCHEMA_CHECK = fastjsonschema.compile(TradingBotConfig.model_json_schema())
+else:
+    _SCHEMA_CHECK = None
+
+# Parsed configs keyed by (path, mtime_ns); re-loads of an unchanged file
+# skip both the YAML parse and the full Pydantic validation pass.
+_CONFIG_CACHE: Dict[Tuple[str, int], TradingBotConfig] = {}
+_CONFIG_CACHE_MAX = 8
+
+# Opt-in pickle sidecar holding the fully validated model: a fresh
+# process then skips YAML parsing and Pydantic validation entirely.
+# Off by default so editing config.yaml during development always takes
+# effect even if a stale sidecar lingers next to it.
+_CONFIG_PICKLE_ENABLED = os.environ.get('MYSIGNALBOT_CONFIG_CACHE') == '1'
+
+
+def load_config(config_path: str, validate: bool = True) -> TradingBotConfig:
+    """Load configuration from YAML file.
+
+    Args:
+        config_path: Path to the YAML config file
+        validate: When False, skip Pydantic validation and build the model
+            with model_construct — only for already-trusted config data
+    """
     config_file = Path(config_path)
     if not config_file.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
-    
-    with open(config_file, 'r') as f:
-        config_data = yaml.safe_load(f)
-    
-    return TradingBotConfig(**config_data)
\ No newline at end of file
+
+    st = config_file.stat()
+    # Absolute path in the key so 'config.yaml' and './config.yaml' share
+    # one cache entry
+    key = (os.path.abspath(config_path), st.st_mtime_ns)
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    # Validated model pickled by a previous process; the stamp ties it to
+    # the exact YAML file contents
+    pickle_cache = Path(str(config_file) + '.cache')
+    if _CONFIG_PICKLE_ENABLED and validate:
+        try:
+            stamp, config = pickle.loads(pickle_cache.read_bytes())
+            if stamp == (st.st_mtime_ns, st.st_size):
+                if len(_CONFIG_CACHE) >= _CONFIG_CACHE_MAX:
+                    _CONFIG_CACHE.clear()
+                _CONFIG_CACHE[key] = config
+                return config
+        except (OSError, pickle.PickleError, ValueError, EOFError, AttributeError):
+            pass
+
+    # A JSON sidecar written on a previous load parses 5-10x faster than
+    # YAML; use it while it is at least as fresh as the YAML file.
+    json_cache = config_file.with_suffix('.json')
+    config_data = None
+    try:
+        if json_cache.exists() and json_cache.stat().st_mtime_ns >= key[1]:
+            config_data = _json_loads(json_cache.read_bytes())
+    except (OSError, ValueError):
+        config_data = None
+
+    if config_data is None:
+        # Map the file instead of reading it: the C YAML loader scans the
+        # mapped region directly, skipping the user-space copy a read()
+        # would make; paging is left to the kernel
+        with open(config_file, 'rb') as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    config_data = yaml.load(mm, Loader=_YamlLoader)
+            except ValueError:
+                # Empty files cannot be mapped
+                config_data = yaml.load(f.read(), Loader=_YamlLoader)
+        try:
+            json_cache.write_bytes(_json_dumps(config_data))
+        except OSError:
+            # Sidecar is purely an optimization; a read-only config
+            # directory just means every load parses YAML
+            pass
+
+    if validate:
+        if _SCHEMA_CHECK is not None:
+            try:
+                _SCHEMA_CHECK(config_data)
+            except fastjsonschema.JsonSchemaException as e:
+                raise ValueError(f"Invalid configuration: {e}") from e
+        config = _TBC_ADAPTER.validate_python(config_data)
+    else:
+        config = TradingBotConfig.model_construct(**config_data)
+    if validate:
+        # Unvalidated constructs are not cached; a later validated load
+        # must not be satisfied by a model_construct result
+        if len(_CONFIG_CACHE) >= _CONFIG_CACHE_MAX:
+            _CONFIG_CACHE.clear()
+        _CONFIG_CACHE[key] = config
+        if _CONFIG_PICKLE_ENABLED:
+            try:
+                tmp = Path(str(pickle_cache) + '.tmp')
+                tmp.write_bytes(pickle.dumps(
+                    ((st.st_mtime_ns, st.st_size), config),
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                ))
+                os.replace(tmp, pickle_cache)
+            except (OSError, pickle.PickleError):
+                # Sidecar is purely an optimization
+                pass
+    return config
+
+
+async def load_config_async(config_path: str) -> TradingBotConfig:
+    """Load configuration without blocking the event loop.
+
+    Runs :func:`load_config` in a worker thread so a config reload
+    triggered from inside the trading loop does not stall it on disk
+    I/O or validation.
+    """
+    return await asyncio.to_thread(load_config, config_path)
\ No newline at end of file
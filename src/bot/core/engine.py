@@ -1,25 +1,75 @@
 """Main trading engine."""
 
 import asyncio
-import uuid
-from typing import Dict, Any, List, Optional, Tuple
-from datetime import datetime, timedelta
+import itertools
+import time
+from collections import deque
+from typing import Awaitable, Callable, Dict, Any, Deque, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
 
 from bot.core.config import TradingBotConfig, load_config
 from bot.core.models import (
     Signal, Order, OrderStatus, OrderType,
-    Side, MarketData, Trade, Position, SignalType
+    Side, MarketData, MarketDataBuffer, Trade, Position, SignalType
 )
 from bot.core.logger import get_logger
 from bot.core.exceptions import TradingBotError, ConnectorError
-from bot.core.registry import registry_manager
+from bot.core.registry import get_registry_manager
 from bot.connectors.base import ConnectorBase
 from bot.connectors.manager import ConnectorManager
+from bot.connectors.mock import MockConnector
 from bot.strategies.base import StrategyBase
 from bot.notifiers.base import NotifierBase
 from bot.notifiers.email import EmailNotifier
 from bot.notifiers.telegram import TelegramNotifier
 from bot.backtest.engine import BacktestEngine
+from bot.utils._json import dumps as _json_dumps
+
+# Bar duration per timeframe, used as the market-data cache TTL
+_TIMEFRAME_SECONDS = {
+    "1m": 60, "5m": 300, "15m": 900, "30m": 1800,
+    "1h": 3600, "4h": 14400, "1d": 86400,
+}
+
+
+def _wrap_sync_signal(fn):
+    """Adapt a legacy synchronous generate_signal to the async contract.
+
+    Paid once at registration so the per-tick path can await every
+    strategy unconditionally.
+    """
+    async def _async_generate_signal(*args, **kwargs):
+        return fn(*args, **kwargs)
+    return _async_generate_signal
+
+
+class SimpleStrategy(StrategyBase):
+    """Simple placeholder strategy used when no registry strategy matches."""
+
+    def __init__(self, cfg: Dict[str, Any]):
+        super().__init__(cfg)
+        self.name = cfg.get("name", "SimpleStrategy")
+
+    async def initialize(self):
+        # placeholder init if the base requires it
+        return
+
+    async def generate_signal(self, data: List[MarketData], current_price: float) -> Optional[Signal]:
+        """Generate a simple signal (always 'hold' by default)."""
+        symbol = data[-1].symbol if data else "BTC/USD"
+        return Signal(
+            symbol=symbol,
+            side=Side.BUY,
+            signal_type=SignalType.HOLD,
+            confidence=0.5,
+            price=current_price,
+            timestamp=data[-1].timestamp if data else datetime.now(timezone.utc),
+            strategy_name=self.name,
+            size=0.0,
+        )
+
+    def get_min_periods(self) -> int:
+        return 50
 
 
 class TradingEngine:
@@ -39,14 +89,70 @@ class TradingEngine:
         self.strategies: List[StrategyBase] = []
         self.notifiers: List[NotifierBase] = []
 
-        # State
+        # State. Bounded deques: a long dry-run appends a signal per
+        # strategy per tick, so unbounded lists leak memory over days
+        history_limit = config.execution.history_limit
         self.positions: Dict[str, Position] = {}
-        self.orders: List[Order] = []
-        self.trades: List[Trade] = []
-        self.signals: List[Signal] = []
+        self.orders: Deque[Order] = deque(maxlen=history_limit)
+        self.trades: Deque[Trade] = deque(maxlen=history_limit)
+        self.signals: Deque[Signal] = deque(maxlen=history_limit)
         self._running = False
         self._initialized = False
 
+        # Timestamp captured once per trading-loop tick and reused by every
+        # signal/order built during that tick
+        self._tick_ts: datetime = datetime.now(timezone.utc)
+
+        # Simulated orders use a process-local sequence; uuid4 per order
+        # reads urandom and formats 36 chars for an ID nothing external
+        # ever sees. Live orders keep UUIDs for cross-restart uniqueness.
+        self._order_seq = itertools.count()
+
+        # Capital allocated per simulated order, resolved once instead of
+        # chasing config attributes on every order
+        self._position_budget: float = (
+            config.advanced.risk_per_trade * config.execution.initial_capital
+        )
+
+        # Filled by initialize(): enabled assets and strategies
+        # pre-partitioned once, so the trading loop does not re-check
+        # .enabled per tick
+        self._enabled_assets: Tuple = ()
+        self._enabled_strategies: Tuple[StrategyBase, ...] = ()
+        self._enabled_notifiers: Tuple[NotifierBase, ...] = ()
+
+        # Concurrency bounds, sized from config in initialize()
+        self._asset_sem: Optional[asyncio.Semaphore] = None
+        self._notify_sem: Optional[asyncio.Semaphore] = None
+
+        # Notifier channels are built and connected on first use
+        self._notifiers_ready = False
+        self._notifier_init_lock = asyncio.Lock()
+
+        # Sub-threshold signal payloads accumulated for the periodic
+        # digest notification; flushed by _flush_digest_periodically
+        self._pending_digest: List[Dict[str, Any]] = []
+        self._digest_task: Optional[asyncio.Task] = None
+
+        # Connector-manager methods bound once after connector init; the
+        # data-fetch helpers call these instead of probing hasattr per call
+        self._price_fn: Optional[Callable[[str], Awaitable[Optional[float]]]] = None
+        self._prices_fn: Optional[Callable[[List[str]], Awaitable[Dict[str, Optional[float]]]]] = None
+        self._md_fn: Optional[Callable[..., Awaitable[Optional[List[MarketData]]]]] = None
+
+        # Market-data cache: (symbol, timeframe, limit) -> (fetch time,
+        # bars), valid for one bar duration, with in-flight futures so
+        # concurrent callers share a single fetch (singleflight)
+        self._md_cache: Dict[Tuple[str, str, int], Tuple[float, List[MarketData]]] = {}
+        self._md_inflight: Dict[Tuple[str, str, int], asyncio.Future] = {}
+        # Columnar OHLCV buffers memoized per cached bar list (see
+        # _market_data_arrays); the bar list itself keeps the entry alive
+        self._md_arrays: Dict[int, Tuple[List[MarketData], MarketDataBuffer]] = {}
+
+        # Full config as a plain dict, dumped exactly once; model_dump
+        # walks the whole nested model, so consumers share this snapshot
+        self._cfg_dict: Dict[str, Any] = config.model_dump()
+
     async def initialize(self) -> None:
         """Initialize all components."""
         self.logger.info("Initializing trading engine...")
@@ -57,158 +163,211 @@ class TradingEngine:
         # Initialize strategies
         await self._initialize_strategies()
 
-        # Initialize notifiers
-        await self._initialize_notifiers()
+        # Snapshot the enabled assets and strategies once; the per-tick
+        # loop iterates fixed tuples and callers use reload_enabled() for
+        # runtime changes. Notifiers are initialized lazily on the first
+        # notification (see _ensure_notifiers), so a bot that never
+        # produces one pays no channel setup cost.
+        self.reload_enabled()
+
+        # Bound the per-tick fan-out so large asset lists cannot swamp
+        # connector rate limits or pile up notifier round trips
+        self._asset_sem = asyncio.Semaphore(self.config.execution.max_concurrency)
+        self._notify_sem = asyncio.Semaphore(self.config.notifications.rate_limit)
 
         self._initialized = True
         self.logger.info("Trading engine initialized successfully")
 
+    def reload_enabled(self) -> None:
+        """Rebuild the pre-filtered enabled asset/strategy tuples.
+
+        Call after toggling an asset or strategy enabled flag at runtime;
+        the trading loop only iterates the snapshots built here.
+        """
+        assets = self.config.assets or []
+        self._enabled_assets = tuple(a for a in assets if a.enabled)
+        self._enabled_strategies = tuple(
+            s for s in self.strategies
+            if not hasattr(s, "is_enabled") or s.is_enabled()
+        )
+
     async def _initialize_connectors(self) -> None:
         """Initialize data connectors."""
         self.logger.info("Initializing connectors...")
 
-        # The ConnectorManager implementation in this repo expects a config dict
-        # with a 'data_providers' key. Pass the full config as dict so manager
-        # can read what it needs.
-        try:
-            cfg_dict = self.config.dict() if hasattr(self.config, "dict") else dict(self.config)
-        except Exception:
-            # As a fallback, attempt to load from yaml path
-            cfg_dict = {}
+        # Build the connectors named by data_providers and hand them to the
+        # manager together with the provider settings it reads
+        dp = self.config.data_providers
+        connectors: List[ConnectorBase] = []
+        for provider in dict.fromkeys(p for p in (dp.primary, dp.secondary, dp.fallback) if p):
+            if provider == "mock":
+                connectors.append(MockConnector({"name": "mock"}))
+            else:
+                self.logger.warning("Unknown data provider '%s'; skipping", provider)
 
-        self.connector_manager = ConnectorManager(cfg_dict)
+        self.connector_manager = ConnectorManager(connectors, self._cfg_dict["data_providers"])
 
         # Connect all (will handle connector-specific connect logic)
         try:
             await self.connector_manager.connect_all()
         except Exception as e:
-            self.logger.error(f"Error connecting connectors: {e}")
+            self.logger.error("Error connecting connectors: %s", e)
             # depending on severity, keep running (some connectors may be optional)
 
+        # The manager type is fixed from here on: bind its fetch methods
+        # once so the hot helpers skip per-call hasattr probing
+        self._price_fn = self.connector_manager.get_price
+        self._prices_fn = self.connector_manager.get_prices
+        self._md_fn = self.connector_manager.get_market_data
+
     async def _initialize_strategies(self) -> None:
         """Initialize trading strategies."""
         self.logger.info("Initializing strategies...")
 
-        # Try to create strategies from registry if available, otherwise
-        # fall back to a simple built-in placeholder strategy.
-        from bot.strategies.base import StrategyBase as BaseStrategy
+        # Strategies come from the registry when available, otherwise the
+        # module-level SimpleStrategy placeholder.
+        # config.strategies is a List[StrategyConfig]; a mapping of
+        # name -> config is accepted too for raw-dict configs
+        strategies_cfg = self.config.strategies or []
+        if isinstance(strategies_cfg, dict):
+            items = list(strategies_cfg.items())
+        else:
+            items = [(getattr(c, "name", str(c)), c) for c in strategies_cfg]
 
-        class SimpleStrategy(BaseStrategy):
-            """Simple placeholder strategy."""
+        # Resolve the strategies registry once rather than per strategy
+        strategies_registry = get_registry_manager().get_registry("strategies")
 
-            def __init__(self, cfg: Dict[str, Any]):
-                super().__init__(cfg)
-                self.name = cfg.get("name", "SimpleStrategy")
+        for name, s_cfg in items:
+            try:
+                # Prefer registry-created strategy if available
+                if strategies_registry and strategies_registry.exists(name):
+                    strategy = strategies_registry.create(name, s_cfg)
+                    if strategy is None:
+                        # fallback to simple strategy if factory failed
+                        strategy = SimpleStrategy(self._strategy_cfg_dict(s_cfg, name))
+                else:
+                    # fallback simple strategy
+                    strategy = SimpleStrategy(self._strategy_cfg_dict(s_cfg, name))
 
-            async def initialize(self):
-                # placeholder init if the base requires it
-                return
+                # The engine awaits generate_signal and initialize
+                # unconditionally; adapt legacy sync implementations here,
+                # once, instead of probing iscoroutine per tick
+                if not asyncio.iscoroutinefunction(strategy.generate_signal):
+                    strategy.generate_signal = _wrap_sync_signal(strategy.generate_signal)
 
-            async def generate_signal(self, data: List[MarketData], current_price: float) -> Optional[Signal]:
-                """Generate a simple signal (always 'hold' by default)."""
-                asset = data[-1].symbol if data else "BTC/USD"
-                return Signal(
-                    asset=asset,
-                    side=Side.BUY,
-                    signal_type=SignalType.HOLD,
-                    size=0.0,
-                    entry_price=current_price,
-                    take_profit=None,
-                    stop_loss=None,
-                    confidence_score=0.5,
-                    strategy_source=self.name,
-                )
+                if asyncio.iscoroutinefunction(strategy.initialize):
+                    await strategy.initialize()
+                else:
+                    strategy.initialize()
 
-            def get_min_periods(self) -> int:
-                return 50
+                self.strategies.append(strategy)
+                self.logger.info("Initialized strategy: %s", strategy.name)
+            except Exception as e:
+                self.logger.error("Failed to initialize strategy %s: %s", name, e)
 
-        # config.strategies is a Dict[str, StrategyConfig] (Pydantic)
-        strategies_cfg = self.config.strategies or {}
-        if isinstance(strategies_cfg, dict):
-            for name, s_cfg in strategies_cfg.items():
-                try:
-                    # Prefer registry-created strategy if available
-                    strategies_registry = registry_manager.get_registry("strategies")
-                    if strategies_registry and strategies_registry.exists(name):
-                        strategy = strategies_registry.create(name, s_cfg)
-                        if strategy is None:
-                            # fallback to simple strategy if factory failed
-                            strategy = SimpleStrategy({"name": name})
-                    else:
-                        # fallback simple strategy
-                        strategy = SimpleStrategy({"name": name})
-
-                    # initialize if async initialize exists
-                    if hasattr(strategy, "initialize"):
-                        maybe = strategy.initialize()
-                        if asyncio.iscoroutine(maybe):
-                            await maybe
-
-                    self.strategies.append(strategy)
-                    self.logger.info(f"Initialized strategy: {getattr(strategy,'name',name)}")
-                except Exception as e:
-                    self.logger.error(f"Failed to initialize strategy {name}: {e}")
-        else:
-            self.logger.warning("No strategies configured (strategies must be a mapping)")
+    @staticmethod
+    def _strategy_cfg_dict(s_cfg, name: str) -> Dict[str, Any]:
+        """Plain dict view of a strategy config for StrategyBase.__init__.
+
+        Pydantic v2 keeps field values in __dict__, so a shallow copy gives
+        the name/enabled/parameters fields without model_dump's recursive
+        walk.
+        """
+        if hasattr(s_cfg, "__dict__") and s_cfg.__dict__:
+            return dict(s_cfg.__dict__)
+        if isinstance(s_cfg, dict):
+            return dict(s_cfg)
+        return {"name": name}
 
     async def _initialize_notifiers(self) -> None:
-        """Initialize notification services."""
+        """Initialize notification services.
+
+        Disabled channels are skipped entirely — no notifier construction
+        and no connect() attempt that would wait out a network timeout on
+        an unconfigured endpoint.
+        """
         self.logger.info("Initializing notifiers...")
 
-        # Telegram notifier
-        # config.notifications may contain a 'telegram' section or not depending on YAML
-        try:
-            telegram_section = {}
-            if hasattr(self.config, "notifications") and getattr(self.config, "notifications", None):
-                tconf = getattr(self.config, "notifications")
-                # support both pydantic model and raw dict
-                if hasattr(tconf, "dict"):
-                    telegram_section = tconf.dict().get("daily_summary", {})  # avoid crash; default
-                # More robust: read from raw config if available
-            # Instead of assuming, attempt to get config dict safely
-            raw_cfg = self.config.dict() if hasattr(self.config, "dict") else {}
-            telegram_cfg = raw_cfg.get("notifications", {}).get("telegram", raw_cfg.get("api_credentials", {}).get("telegram", {}))
-        except Exception:
-            telegram_cfg = {}
-
-        telegram_notifier = TelegramNotifier({"telegram": telegram_cfg})
-        try:
-            await telegram_notifier.connect()
-            self.notifiers.append(telegram_notifier)
-            if telegram_notifier.enabled:
-                self.logger.info("Telegram notifier connected")
+        notifications = self.config.notifications
+        telegram_cfg = dict(notifications.telegram.__dict__)
+        if not telegram_cfg.get("bot_token"):
+            # fall back to credentials stored under api_credentials, but
+            # only for keys the notifications section left unset — the
+            # typed config always carries empty-string defaults, and a
+            # plain dict merge would let those clobber the credentials
+            for key, value in dict(self.config.api_credentials.telegram).items():
+                if not telegram_cfg.get(key):
+                    telegram_cfg[key] = value
+        email_cfg = dict(notifications.email.__dict__)
+
+        pending: List[Tuple[str, NotifierBase]] = []
+        if notifications.telegram.enable_notifications:
+            pending.append(("Telegram", TelegramNotifier({"telegram": telegram_cfg})))
+        else:
+            self.logger.info("Telegram notifications disabled; skipping notifier")
+
+        if notifications.email.enable_notifications:
+            try:
+                pending.append(("Email", EmailNotifier({"email": email_cfg})))
+            except Exception as e:
+                self.logger.warning("Failed to initialize email notifier: %s", e)
+        else:
+            self.logger.info("Email notifications disabled; skipping notifier")
+
+        if not pending:
+            return
+
+        # Connect channels concurrently; each connect is an independent
+        # network round-trip, so total init time is the slowest channel,
+        # not the sum
+        outcomes = await asyncio.gather(
+            *(notifier.connect() for _, notifier in pending),
+            return_exceptions=True,
+        )
+        for (channel, notifier), outcome in zip(pending, outcomes):
+            if isinstance(outcome, BaseException):
+                self.logger.warning("Failed to connect %s notifier: %s", channel, outcome)
+                continue
+            self.notifiers.append(notifier)
+            if getattr(notifier, "enabled", False):
+                self.logger.info("%s notifier connected", channel)
             else:
-                self.logger.info("Telegram notifier initialized but disabled")
-        except Exception as e:
-            self.logger.warning(f"Failed to connect Telegram notifier: {e}")
+                self.logger.info("%s notifier initialized but disabled", channel)
 
-        # Email notifier (best-effort)
-        try:
-            raw_cfg = self.config.dict() if hasattr(self.config, "dict") else {}
-            email_cfg = raw_cfg.get("notifications", {}).get("email", {})
-        except Exception:
-            email_cfg = {}
+    async def _ensure_notifiers(self) -> None:
+        """Build and connect notifier channels on first use.
 
-        try:
-            email_notifier = EmailNotifier({"email": email_cfg})
-            await email_notifier.connect()
-            self.notifiers.append(email_notifier)
-            if getattr(email_notifier, "enabled", False):
-                self.logger.info("Email notifier connected")
-        except Exception as e:
-            self.logger.warning(f"Failed to initialize/connect email notifier: {e}")
+        The lock collapses concurrent first notifications into a single
+        initialization; subsequent calls see _notifiers_ready and return
+        without awaiting.
+        """
+        async with self._notifier_init_lock:
+            if self._notifiers_ready:
+                return
+            await self._initialize_notifiers()
+            self._enabled_notifiers = tuple(
+                n for n in self.notifiers if getattr(n, "enabled", True)
+            )
+            self._notifiers_ready = True
 
     async def start(self) -> None:
         """Start trading engine."""
+        # Eager tasks (3.12+): coroutines that finish without suspending
+        # (cache hits, HOLD signals, disabled notifiers) complete inline
+        # instead of round-tripping through the scheduler
+        if hasattr(asyncio, "eager_task_factory"):
+            asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
         if not self._initialized:
             await self.initialize()
 
         self.logger.info("Starting trading engine...")
-        self.logger.info(f"Mode: {self.config.mode}")
+        self.logger.info("Mode: %s", self.config.mode)
 
         if self.config.mode == "backtest":
             await self.run_backtest()
         elif self.config.mode in ["dry-run", "live"]:
+            self._digest_task = asyncio.create_task(self._flush_digest_periodically())
             await self.run_trading_loop()
         else:
             raise ValueError(f"Unknown mode: {self.config.mode}")
@@ -218,19 +377,25 @@ class TradingEngine:
         self.logger.info("Stopping trading engine...")
         self._running = False
 
+        # Stop the digest flusher and emit anything still queued
+        if self._digest_task is not None:
+            self._digest_task.cancel()
+            self._digest_task = None
+        await self._flush_digest()
+
         # Disconnect connectors
         if self.connector_manager:
             try:
                 await self.connector_manager.disconnect_all()
             except Exception as e:
-                self.logger.error(f"Error disconnecting connectors: {e}")
+                self.logger.error("Error disconnecting connectors: %s", e)
 
         # Disconnect notifiers
         for notifier in self.notifiers:
             try:
                 await notifier.disconnect()
             except Exception as e:
-                self.logger.error(f"Error disconnecting notifier: {e}")
+                self.logger.error("Error disconnecting notifier: %s", e)
 
         self.logger.info("Trading engine stopped")
 
@@ -239,115 +404,239 @@ class TradingEngine:
         self._running = True
         self.logger.info("Starting trading loop...")
 
+        loop = asyncio.get_running_loop()
+        interval = self.config.execution.tick_interval_s
+        next_tick = loop.time()
+
         try:
             while self._running:
-                # Process each asset
-                for asset in self.config.assets:
-                    if not getattr(asset, "enabled", True):
-                        continue
-
-                    try:
-                        await self.process_asset(asset)
-                    except Exception as e:
-                        self.logger.error(f"Error processing asset {getattr(asset,'symbol',str(asset))}: {e}")
-
-                # Wait for next iteration
-                await asyncio.sleep(60)  # 1 minute interval
+                # One timestamp per tick; callees reuse it instead of each
+                # paying for their own datetime construction
+                self._tick_ts = datetime.fromtimestamp(time.time(), tz=timezone.utc)
+
+                # One batched price fetch per tick, then process enabled
+                # assets concurrently; one slow feed no longer delays the
+                # others
+                prices = await self._get_prices([a.symbol for a in self._enabled_assets])
+                results = await asyncio.gather(
+                    *(self.process_asset(a, prices.get(a.symbol)) for a in self._enabled_assets),
+                    return_exceptions=True
+                )
+                for asset, outcome in zip(self._enabled_assets, results):
+                    if isinstance(outcome, Exception):
+                        self.logger.error("Error processing asset %s: %s", asset.symbol, outcome)
+
+                # Sleep until the next scheduled tick rather than a fixed
+                # 60s after processing, so cadence does not drift by the
+                # processing time of each pass
+                next_tick += interval
+                now = loop.time()
+                if now > next_tick:
+                    missed = int((now - next_tick) // interval) + 1
+                    self.logger.warning(
+                        "Tick processing overran schedule by %.1fs; skipping %d tick(s)",
+                        now - next_tick, missed,
+                    )
+                    next_tick += missed * interval
+                await asyncio.sleep(max(0.0, next_tick - loop.time()))
 
         except KeyboardInterrupt:
             self.logger.info("Received interrupt signal")
         except Exception as e:
-            self.logger.error(f"Error in trading loop: {e}")
+            self.logger.error("Error in trading loop: %s", e)
             raise
         finally:
             await self.stop()
 
     # Helper wrappers to cope with different connector manager method names
     async def _get_price(self, symbol: str) -> Optional[float]:
-        """Attempt to get a price using available connector-manager methods."""
-        if self.connector_manager is None:
+        """Get a price through the bound connector-manager method."""
+        if self._price_fn is None:
+            return None
+        try:
+            return await self._price_fn(symbol)
+        except Exception as e:
+            self.logger.debug("get_price failed: %s", e)
             return None
 
-        # try common method names with fallbacks
-        if hasattr(self.connector_manager, "get_price"):
-            try:
-                return await self.connector_manager.get_price(symbol)
-            except Exception as e:
-                self.logger.debug(f"get_price failed: {e}")
-
-        if hasattr(self.connector_manager, "get_price_with_failover"):
-            try:
-                price, _ = await self.connector_manager.get_price_with_failover(symbol)
-                return price
-            except Exception as e:
-                self.logger.debug(f"get_price_with_failover failed: {e}")
+    async def _get_prices(self, symbols: List[str]) -> Dict[str, Optional[float]]:
+        """Fetch prices for all symbols in one batched manager call."""
+        if self._prices_fn is None:
+            return {symbol: None for symbol in symbols}
+        try:
+            return await self._prices_fn(symbols)
+        except Exception as e:
+            self.logger.debug("get_prices failed: %s", e)
+            return {symbol: None for symbol in symbols}
 
-        if hasattr(self.connector_manager, "get_aggregated_price"):
-            try:
-                price, meta = await self.connector_manager.get_aggregated_price(symbol)
-                return price
-            except Exception as e:
-                self.logger.debug(f"get_aggregated_price failed: {e}")
+    async def _get_market_data(self, symbol: str, timeframe: str = "1h", limit: int = 200) -> Optional[List[MarketData]]:
+        """Get market data, cached for the duration of one bar.
 
-        self.logger.error("No connector method available to get price")
-        return None
+        Repeat requests within the timeframe's TTL are served from cache,
+        and concurrent requests for the same key await one shared fetch
+        instead of each hitting the connector.
+        """
+        key = (symbol, timeframe, limit)
+        cached = self._md_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _TIMEFRAME_SECONDS.get(timeframe, 3600.0):
+            return cached[1]
 
-    async def _get_market_data(self, symbol: str, timeframe: str = "1h", limit: int = 200) -> Optional[List[MarketData]]:
-        """Attempt to get market data with available connector-manager methods."""
-        if self.connector_manager is None:
-            return None
+        inflight = self._md_inflight.get(key)
+        if inflight is not None:
+            return await inflight
 
-        if hasattr(self.connector_manager, "get_market_data"):
-            try:
-                return await self.connector_manager.get_market_data(symbol, timeframe=timeframe, limit=limit)
-            except Exception as e:
-                self.logger.debug(f"get_market_data failed: {e}")
+        fut: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._md_inflight[key] = fut
+        try:
+            data = await self._fetch_market_data(symbol, timeframe, limit)
+            if data:
+                self._md_cache[key] = (time.monotonic(), data)
+            fut.set_result(data)
+            return data
+        except BaseException as e:
+            fut.set_exception(e)
+            # mark retrieved in case no other caller is waiting
+            fut.exception()
+            raise
+        finally:
+            self._md_inflight.pop(key, None)
 
-        if hasattr(self.connector_manager, "get_market_data_with_failover"):
-            try:
-                data, _ = await self.connector_manager.get_market_data_with_failover(symbol, timeframe=timeframe, limit=limit)
-                return data
-            except Exception as e:
-                self.logger.debug(f"get_market_data_with_failover failed: {e}")
+    async def _fetch_market_data(self, symbol: str, timeframe: str, limit: int) -> Optional[List[MarketData]]:
+        """Fetch market data through the bound connector-manager method."""
+        if self._md_fn is None:
+            return None
+        try:
+            return await self._md_fn(symbol, timeframe=timeframe, limit=limit)
+        except Exception as e:
+            self.logger.debug("get_market_data failed: %s", e)
+            return None
 
-        self.logger.error("No connector method available to get market data")
-        return None
+    def _market_data_arrays(self, market_data: List[MarketData]) -> MarketDataBuffer:
+        """Columnar OHLCV buffer for a cached bar list.
 
-    async def process_asset(self, asset) -> None:
+        Memoized on the identity of the list, which the market-data cache
+        returns unchanged for a full bar duration, so the conversion runs
+        once per fetch instead of once per tick.
+        """
+        key = id(market_data)
+        cached = self._md_arrays.get(key)
+        if cached is not None and cached[0] is market_data:
+            return cached[1]
+        buf = MarketDataBuffer.from_bars(market_data)
+        if len(self._md_arrays) > 64:
+            self._md_arrays.clear()
+        self._md_arrays[key] = (market_data, buf)
+        return buf
+
+    async def process_asset(self, asset, current_price: Optional[float] = None) -> None:
         """Process a single asset.
 
         Args:
             asset: Asset configuration
+            current_price: Price already fetched by the batched per-tick
+                lookup; fetched here when not provided
         """
-        # Get current price
-        current_price = await self._get_price(getattr(asset, "symbol", asset))
+        if self._asset_sem is not None:
+            async with self._asset_sem:
+                await self._process_asset(asset, current_price)
+        else:
+            await self._process_asset(asset, current_price)
+
+    async def _process_asset(self, asset, current_price: Optional[float] = None) -> None:
+        symbol = asset.symbol
+
         if current_price is None:
-            self.logger.warning(f"Could not get price for {getattr(asset, 'symbol', asset)}")
+            # No batched price for this symbol: fetch price and market data
+            # concurrently; wall time is the max of the two round trips
+            current_price, market_data = await asyncio.gather(
+                self._get_price(symbol),
+                self._get_market_data(symbol, timeframe="1h", limit=200),
+            )
+        else:
+            market_data = await self._get_market_data(symbol, timeframe="1h", limit=200)
+        if current_price is None:
+            self.logger.warning("Could not get price for %s", symbol)
             return
-
-        # Get market data
-        market_data = await self._get_market_data(getattr(asset, "symbol", asset), timeframe="1h", limit=200)
         if not market_data:
-            self.logger.warning(f"Could not get market data for {getattr(asset, 'symbol', asset)}")
+            self.logger.warning("Could not get market data for %s", symbol)
             return
 
-        # Generate signals from strategies
-        for strategy in self.strategies:
-            # strategy may provide is_enabled or similar
-            if hasattr(strategy, "is_enabled") and not strategy.is_enabled():
-                continue
+        # Columnar view built once per fetch and memoized against the bar
+        # list; every strategy shares the same contiguous arrays instead of
+        # re-walking 200 MarketData objects
+        arr = self._market_data_arrays(market_data)
 
+        async def _call_strategy(strategy) -> Optional[Signal]:
             try:
-                maybe = strategy.generate_signal(market_data, current_price)
-                if asyncio.iscoroutine(maybe):
-                    signal = await maybe
-                else:
-                    signal = maybe
+                return await strategy.generate_signal(market_data, current_price, arrays=arr)
+            except TypeError:
+                # strategy predates the arrays keyword
+                return await strategy.generate_signal(market_data, current_price)
+
+        # Fan strategy inference across the event loop (enabled set fixed
+        # at initialize)
+        outcomes = await asyncio.gather(
+            *(_call_strategy(s) for s in self._enabled_strategies),
+            return_exceptions=True
+        )
+        for strategy, outcome in zip(self._enabled_strategies, outcomes):
+            if isinstance(outcome, Exception):
+                self.logger.error("Error generating signal from %s: %s", strategy.name, outcome)
+            elif outcome:
+                await self.process_signal(outcome)
+
+    async def _notify_all(self, make_coro: Callable[[NotifierBase], Awaitable]) -> None:
+        """Fan a notification out to every enabled notifier and log failures.
+
+        Takes a per-notifier coroutine factory rather than pre-built
+        coroutines: the enabled set is only known after the lazy
+        _ensure_notifiers has run, so the calls must be built here, after
+        it. Wall time becomes the slowest notifier instead of the sum of
+        all round trips; one failing notifier does not block the others.
+        The notify semaphore caps in-flight sends across concurrent
+        signals.
+        """
+        if not self._notifiers_ready:
+            await self._ensure_notifiers()
+        sem = self._notify_sem
+
+        async def _bounded(coro):
+            if sem is None:
+                return await coro
+            async with sem:
+                return await coro
+
+        results = await asyncio.gather(
+            *(_bounded(make_coro(n)) for n in self._enabled_notifiers),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.error("Notifier error: %s", result)
 
-                if signal:
-                    await self.process_signal(signal)
-            except Exception as e:
-                self.logger.error(f"Error generating signal from {getattr(strategy,'name','unknown')}: {e}")
+    async def _flush_digest_periodically(self) -> None:
+        """Emit one combined notification for queued sub-threshold signals."""
+        interval = self.config.notifications.digest_interval_s
+        try:
+            while True:
+                await asyncio.sleep(interval)
+                await self._flush_digest()
+        except asyncio.CancelledError:
+            pass
+
+    async def _flush_digest(self) -> None:
+        if not self._pending_digest:
+            return
+        pending, self._pending_digest = self._pending_digest, []
+
+        message = f"Signal digest: {len(pending)} sub-threshold signal(s)\n" + "\n".join(
+            f"{p['strategy']}: {p['side'].upper()} {p['asset']} @ {p['price']} ({p['confidence']:.0%})"
+            for p in pending
+        )
+        payload_json = _json_dumps({"digest": pending})
+        await self._notify_all(
+            lambda notifier: notifier.send_message(message, payload=payload_json)
+        )
 
     async def process_signal(self, signal: Signal) -> None:
         """Process trading signal.
@@ -355,50 +644,55 @@ class TradingEngine:
         Args:
             signal: Trading signal
         """
-        # Normalize names from Signal dataclass
         self.signals.append(signal)
-        asset = getattr(signal, "asset", "UNKNOWN")
-        confidence = getattr(signal, "confidence_score", getattr(signal, "confidence", 0.0))
-        strategy_name = getattr(signal, "strategy_source", getattr(signal, "strategy_name", "unknown"))
-        price = getattr(signal, "entry_price", getattr(signal, "price", None))
+        confidence = signal.confidence
 
         self.logger.info(
-            f"Received signal: {strategy_name} - {getattr(signal,'side').value.upper()} "
-            f"{asset} @ {price if price is not None else 'N/A'} (confidence: {confidence:.2%})"
+            "Received signal: %s - %s %s @ %s (confidence: %.2f%%)",
+            signal.strategy_name, signal.side.value.upper(), signal.symbol,
+            signal.price, confidence * 100,
         )
 
-        # ALWAYS notify so you see activity even when confidence is low
+        # Sub-threshold signals are queued into a periodic digest instead
+        # of paying per-signal notifier round trips for "nothing happened"
+        if confidence < self.config.execution.min_confidence_threshold:
+            self._pending_digest.append({
+                "asset": signal.symbol,
+                "strategy": signal.strategy_name,
+                "side": signal.side.value,
+                "price": signal.price,
+                "confidence": confidence,
+            })
+            self.logger.info("Signal confidence below threshold; queued for digest, not executing order.")
+            return
+
         notify_payload = {
-            "asset": asset,
-            "strategy": strategy_name,
-            "side": getattr(signal, "side").value if getattr(signal, "side") else "N/A",
-            "price": price,
+            "asset": signal.symbol,
+            "strategy": signal.strategy_name,
+            "side": signal.side.value,
+            "price": signal.price,
             "confidence": confidence,
-            "status": "below_threshold" if confidence < self.config.execution.min_confidence_threshold else "accepted"
+            "status": "accepted",
         }
 
-        for notifier in self.notifiers:
-            try:
-                # prefer high-level notify_signal if provided by notifier base
-                if hasattr(notifier, "notify_signal"):
-                    await notifier.notify_signal(signal)
-                else:
-                    # fallback: send a compact message
-                    msg = (
-                        f"Signal from {notify_payload['strategy']}\n"
-                        f"{notify_payload['asset']} {notify_payload['side']}\n"
-                        f"Price: {notify_payload['price']}\n"
-                        f"Confidence: {notify_payload['confidence']:.2%}\n"
-                        f"Status: {notify_payload['status']}"
-                    )
-                    await notifier.send_message(msg)
-            except Exception as e:
-                self.logger.error(f"Error notifying signal with {notifier}: {e}")
+        # Serialize the payload and format the fallback message once instead
+        # of per notifier; structured notifiers get the pre-built JSON bytes
+        # via kwargs rather than re-serializing the same dict.
+        payload_json = _json_dumps(notify_payload)
+        fallback_msg = (
+            f"Signal from {notify_payload['strategy']}\n"
+            f"{notify_payload['asset']} {notify_payload['side']}\n"
+            f"Price: {notify_payload['price']}\n"
+            f"Confidence: {notify_payload['confidence']:.2%}\n"
+            f"Status: {notify_payload['status']}"
+        )
 
-        # If below confidence threshold, do not execute orders but still log / notify as above
-        if confidence < self.config.execution.min_confidence_threshold:
-            self.logger.info("Signal confidence below threshold; not executing order (notification already sent).")
-            return
+        # prefer high-level notify_signal where the notifier provides it
+        await self._notify_all(
+            lambda notifier: notifier.notify_signal(signal)
+            if hasattr(notifier, "notify_signal")
+            else notifier.send_message(fallback_msg, payload=payload_json)
+        )
 
         # Execute signal based on mode
         if self.config.mode == "live":
@@ -421,53 +715,40 @@ class TradingEngine:
         Args:
             signal: Trading signal
         """
-        order_id = str(uuid.uuid4())
-        price = getattr(signal, "entry_price", None)
-        # Determine position sizing: prefer fixed_amount if present
-        ps = getattr(self.config, "risk_management", None)
-        fixed_amount = None
-        try:
-            if ps and hasattr(ps, "position_sizing") and hasattr(ps.position_sizing, "fixed_amount"):
-                fixed_amount = ps.position_sizing.fixed_amount
-        except Exception:
-            fixed_amount = None
-
-        if not fixed_amount:
-            # fallback default
-            fixed_amount = 100.0
+        order_id = f"sim-{next(self._order_seq)}"
+        price = signal.price
 
         quantity = 0.0
         if price and price > 0:
-            quantity = fixed_amount / price
+            quantity = self._position_budget / price
 
         order = Order(
-            order_id=order_id,
-            asset=getattr(signal, "asset", "UNKNOWN"),
-            side=getattr(signal, "side"),
+            id=order_id,
+            symbol=signal.symbol,
+            side=signal.side,
             order_type=OrderType.MARKET,
             quantity=quantity,
             price=price,
             status=OrderStatus.FILLED,
             filled_quantity=quantity,
             filled_price=price,
-            timestamp=datetime.utcnow(),
-            signal_id=None,
-            exchange_order_id=None,
-            fees=0.0,
-            metadata={"simulated": True, "strategy": getattr(signal, "strategy_source", None)}
+            timestamp=self._tick_ts,
+            strategy_name=signal.strategy_name,
+            metadata={"simulated": True}
         )
 
         self.orders.append(order)
-        self.logger.info(f"Simulated order: {order.side.value.upper()} {order.quantity:.6f} {order.asset} @ {order.price if order.price else 'N/A'}")
+        self.logger.info("Simulated order: %s %.6f %s @ %s", order.side.value.upper(), order.quantity, order.symbol, order.price if order.price else 'N/A')
 
     async def run_backtest(self) -> None:
         """Run backtest."""
         self.logger.info("Running backtest...")
 
+        backtesting = self.config.backtesting
         backtest_config = {
-            "initial_capital": getattr(self.config.backtesting, "initial_capital", 10000.0),
-            "commission": getattr(self.config.backtesting, "commission", 0.0),
-            "slippage": getattr(self.config.backtesting, "slippage", 0.0),
+            "initial_capital": backtesting.initial_capital,
+            "commission": backtesting.commission,
+            "slippage": backtesting.slippage,
         }
 
         backtest_engine = BacktestEngine(backtest_config)
@@ -478,7 +759,7 @@ class TradingEngine:
             self.logger.error("No assets configured for backtest")
             return
 
-        market_data = await self._get_market_data(getattr(asset, "symbol", asset), timeframe="1h", limit=1000)
+        market_data = await self._get_market_data(asset.symbol, timeframe="1h", limit=1000)
 
         if not market_data or len(market_data) < 100:
             self.logger.error("Not enough data for backtest")
@@ -489,49 +770,38 @@ class TradingEngine:
             self.logger.error("No strategies configured for backtest")
             return
 
-        # Backtest engine API may vary — attempt common signature
-        try:
-            result = await backtest_engine.run_backtest(self.strategies[0], market_data, getattr(asset, "symbol", "UNKNOWN"))
-        except TypeError:
-            # Try alternate signature
-            result = await backtest_engine.run_backtest(market_data, self.strategies[0], getattr(asset, "symbol", "UNKNOWN"))
+        result = await backtest_engine.run_backtest(self.strategies[0], market_data, asset.symbol)
 
-        # Print results (handle attribute access defensively)
+        # Print results
         self.logger.info("=" * 60)
         self.logger.info("BACKTEST RESULTS")
         self.logger.info("=" * 60)
-        try:
-            self.logger.info(f"Initial Capital: ${result.initial_capital:,.2f}")
-            self.logger.info(f"Final Capital:   ${result.final_capital:,.2f}")
-            self.logger.info(f"Total Return:    {result.total_return:.2%}")
-            self.logger.info(f"Total Trades:    {result.total_trades}")
-            self.logger.info(f"Winning Trades:  {result.winning_trades}")
-            self.logger.info(f"Losing Trades:   {result.losing_trades}")
-            self.logger.info(f"Win Rate:        {result.win_rate:.2%}")
-            self.logger.info(f"Max Drawdown:    {result.max_drawdown:.2%}")
-            self.logger.info(f"Sharpe Ratio:    {result.sharpe_ratio:.2f}")
-            self.logger.info(f"Sortino Ratio:   {result.sortino_ratio:.2f}")
-            self.logger.info(f"Profit Factor:   {result.profit_factor:.2f}")
-        except Exception:
-            # If result is a dict-like
-            try:
-                r = result if isinstance(result, dict) else getattr(result, "to_dict", lambda: {})()
-                self.logger.info(f"Initial Capital: ${r.get('initial_capital', 0):,.2f}")
-                self.logger.info(f"Final Capital:   ${r.get('final_capital', 0):,.2f}")
-            except Exception as e:
-                self.logger.error(f"Unable to print backtest results: {e}")
-
+        self.logger.info(f"Initial Capital: ${result.initial_capital:,.2f}")
+        self.logger.info(f"Final Capital:   ${result.final_capital:,.2f}")
+        self.logger.info(f"Total Return:    {result.total_return:.2%}")
+        self.logger.info(f"Total Trades:    {result.total_trades}")
+        self.logger.info(f"Winning Trades:  {result.winning_trades}")
+        self.logger.info(f"Losing Trades:   {result.losing_trades}")
+        self.logger.info(f"Win Rate:        {result.win_rate:.2%}")
+        self.logger.info(f"Max Drawdown:    {result.max_drawdown:.2%}")
+        self.logger.info(f"Sharpe Ratio:    {result.sharpe_ratio:.2f}")
+        self.logger.info(f"Sortino Ratio:   {result.sortino_ratio:.2f}")
+        self.logger.info(f"Profit Factor:   {result.profit_factor:.2f}")
         self.logger.info("=" * 60)
 
-        # Notify results
-        for notifier in self.notifiers:
-            try:
-                message = (
-                    f"*Backtest Results*\n\n"
-                    f"Initial Capital: ${getattr(result, 'initial_capital', 'N/A')}\n"
-                    f"Final Capital: {getattr(result, 'final_capital', 'N/A')}\n"
-                )
-                if hasattr(notifier, "send_message"):
-                    await notifier.send_message(message)
-            except Exception as e:
-                self.logger.error(f"Error notifying backtest results: {e}")
+        # Notify results: build the message and JSON payload once, then fan
+        # out to notifiers instead of re-formatting per notifier
+        message = (
+            f"*Backtest Results*\n\n"
+            f"Initial Capital: ${result.initial_capital:,.2f}\n"
+            f"Final Capital: ${result.final_capital:,.2f}\n"
+        )
+        payload_json = _json_dumps({
+            "initial_capital": result.initial_capital,
+            "final_capital": result.final_capital,
+            "total_return": result.total_return,
+            "total_trades": result.total_trades,
+        })
+        await self._notify_all(
+            lambda notifier: notifier.send_message(message, payload=payload_json)
+        )
@@ -1,11 +1,20 @@
 """Logging configuration."""
 
+import atexit
 import logging
+import queue
 import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 from pathlib import Path
 
 
+# Listener owning the real handlers; log records reach it through a queue
+# so the emitting thread (the event loop) never blocks on disk I/O
+_listener: Optional[QueueListener] = None
+
+
 def setup_logger(
     name: str = "trading-bot",
     level: str = "INFO",
@@ -13,31 +22,42 @@ def setup_logger(
     log_file: Optional[str] = None,
     rotation: bool = True
 ) -> logging.Logger:
-    """Setup logger with console and optional file handlers."""
-    
+    """Setup logger with console and optional file handlers.
+
+    The logger itself only carries a QueueHandler; console and file
+    handlers run on a background QueueListener thread, so a slow disk or
+    a file rotation cannot stall the caller.
+    """
+    global _listener
+
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, level.upper()))
-    
-    # Clear existing handlers
+
+    # Clear existing handlers and stop any previous listener
     logger.handlers.clear()
-    
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
     # Default format
     if log_format is None:
         log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    
+
     formatter = logging.Formatter(log_format)
-    
+
+    handlers = []
+
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(getattr(logging, level.upper()))
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-    
+    handlers.append(console_handler)
+
     # File handler
     if log_file:
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
-        
+
         if rotation:
             from logging.handlers import RotatingFileHandler
             file_handler = RotatingFileHandler(
@@ -47,24 +67,43 @@ def setup_logger(
             )
         else:
             file_handler = logging.FileHandler(log_file)
-        
+
         file_handler.setLevel(getattr(logging, level.upper()))
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-    
+        handlers.append(file_handler)
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_stop_listener)
+
     return logger
 
 
-# Global logger instance
+def _stop_listener() -> None:
+    """Flush and stop the background logging listener."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+# Global logger instance; the lock serializes first-use setup when
+# modules resolve their loggers from concurrent import threads
 _logger: Optional[logging.Logger] = None
+_logger_init_lock = threading.Lock()
 
 
 def get_logger(name: Optional[str] = None) -> logging.Logger:
     """Get global logger instance."""
     global _logger
     if _logger is None:
-        _logger = setup_logger()
-    
+        with _logger_init_lock:
+            if _logger is None:
+                _logger = setup_logger()
+
     if name:
         return logging.getLogger(f"{_logger.name}.{name}")
-    return _logger
\ No newline at end of file
+    return _logger
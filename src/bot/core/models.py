@@ -1,11 +1,14 @@
 """Data models for trading bot."""
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Optional, Dict, Any, List
 from decimal import Decimal
 
+import numpy as np
+
 
 class Side(str, Enum):
     """Order side."""
@@ -37,7 +40,7 @@ class SignalType(str, Enum):
     HOLD = "hold"
 
 
-@dataclass
+@dataclass(slots=True)
 class Signal:
     """Trading signal."""
     symbol: str
@@ -50,10 +53,16 @@ class Signal:
     take_profit: Optional[float] = None
     stop_loss: Optional[float] = None
     size: Optional[float] = None
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Optional[Dict[str, Any]] = None
+
+    def __post_init__(self):
+        # Interned so positions/price-cache lookups keyed on these strings
+        # hit the pointer-equality fast path
+        self.symbol = sys.intern(self.symbol)
+        self.strategy_name = sys.intern(self.strategy_name)
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """Order."""
     id: str
@@ -70,10 +79,10 @@ class Order:
     strategy_name: Optional[str] = None
     take_profit: Optional[float] = None
     stop_loss: Optional[float] = None
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Position."""
     symbol: str
@@ -87,7 +96,7 @@ class Position:
     updated_at: Optional[datetime] = None
     take_profit: Optional[float] = None
     stop_loss: Optional[float] = None
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Optional[Dict[str, Any]] = None
     
     @property
     def value(self) -> float:
@@ -100,7 +109,7 @@ class Position:
         return abs(self.quantity) > 0.0001
 
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     """Trade (filled order)."""
     id: str
@@ -111,16 +120,17 @@ class Trade:
     price: float
     timestamp: datetime
     commission: float = 0.0
+    realized_pnl: float = 0.0
     strategy_name: Optional[str] = None
-    metadata: Dict[str, Any] = field(default_factory=dict)
-    
+    metadata: Optional[Dict[str, Any]] = None
+
     @property
     def value(self) -> float:
         """Trade value."""
         return self.quantity * self.price
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketData:
     """Market data."""
     symbol: str
@@ -139,7 +149,41 @@ class MarketData:
         return (self.high + self.low) / 2
 
 
-@dataclass
+@dataclass(slots=True)
+class MarketDataBuffer:
+    """Columnar (struct-of-arrays) view of a MarketData window.
+
+    One contiguous float64 array per OHLCV field, so indicators and
+    strategies can run numpy kernels directly instead of re-extracting
+    attributes bar by bar.
+    """
+    symbol: str
+    timestamps: List[datetime]
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    @classmethod
+    def from_bars(cls, data: List["MarketData"]) -> "MarketDataBuffer":
+        """Build a buffer from a list of MarketData bars."""
+        n = len(data)
+        return cls(
+            symbol=data[0].symbol if data else "",
+            timestamps=[md.timestamp for md in data],
+            open=np.fromiter((md.open for md in data), dtype=np.float64, count=n),
+            high=np.fromiter((md.high for md in data), dtype=np.float64, count=n),
+            low=np.fromiter((md.low for md in data), dtype=np.float64, count=n),
+            close=np.fromiter((md.close for md in data), dtype=np.float64, count=n),
+            volume=np.fromiter((md.volume for md in data), dtype=np.float64, count=n),
+        )
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+
+@dataclass(slots=True)
 class BacktestResult:
     """Backtest result."""
     initial_capital: float
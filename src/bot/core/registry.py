@@ -1,5 +1,6 @@
 """Registry system for plugins."""
 
+import sys
 from typing import Type, Dict, Any, Optional, TypeVar, Callable
 from abc import ABC
 
@@ -9,16 +10,24 @@ T = TypeVar('T', bound=ABC)
 
 class Registry:
     """Registry for plugins."""
-    
+
+    # Lookups run per symbol/strategy iteration; slots skip the instance
+    # __dict__ on every self._items access
+    __slots__ = ('name', '_items')
+
     def __init__(self, name: str):
         """Initialize registry."""
         self.name = name
         self._items: Dict[str, Type[T]] = {}
-    
+
     def register(self, name: str) -> Callable:
         """Decorator to register a plugin."""
-        def decorator(cls: Type[T]) -> Type[T]:
-            self._items[name] = cls
+        # Interned keys make get()/has() compare by pointer for the
+        # literal names callers pass in; binding the dict and key as
+        # defaults keeps self out of the closure and skips the attribute
+        # walk when the decorator runs
+        def decorator(cls: Type[T], _items=self._items, _name=sys.intern(name)) -> Type[T]:
+            _items[_name] = cls
             return cls
         return decorator
     
@@ -50,7 +59,9 @@ class Registry:
 
 class RegistryManager:
     """Manager for multiple registries."""
-    
+
+    __slots__ = ('_registries',)
+
     def __init__(self):
         """Initialize registry manager."""
         self._registries: Dict[str, Registry] = {}
@@ -72,13 +83,12 @@ class RegistryManager:
         return list(self._registries.keys())
 
 
-# Global registry manager instance
-_registry_manager: Optional[RegistryManager] = None
+# Global registry manager instance, created eagerly at import: module
+# import is serialized by the interpreter, so unlike lazy init this is
+# race-free when strategies load from concurrent tasks
+_registry_manager = RegistryManager()
 
 
 def get_registry_manager() -> RegistryManager:
     """Get global registry manager instance."""
-    global _registry_manager
-    if _registry_manager is None:
-        _registry_manager = RegistryManager()
     return _registry_manager
\ No newline at end of file
@@ -1,11 +1,12 @@
 """Base indicator class."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, Union
 from datetime import datetime
+import numpy as np
 import pandas as pd
 
-from bot.core.models import MarketData
+from bot.core.models import MarketData, MarketDataBuffer
 
 
 class IndicatorBase(ABC):
@@ -21,6 +22,10 @@ class IndicatorBase(ABC):
         self.name = config.get('name', self.__class__.__name__)
         self.parameters = config.get('parameters', {})
         self._initialized = False
+        # Last (key, frame) built by to_dataframe; indicators calculate
+        # over the same window repeatedly within a tick, so reuse the
+        # frame when the underlying list is unchanged
+        self._df_cache: Optional[Tuple[Tuple[int, int, datetime], pd.DataFrame]] = None
     
     @abstractmethod
     def calculate(self, data: List[MarketData]) -> List[float]:
@@ -50,29 +55,54 @@ class IndicatorBase(ABC):
         """
         return True
     
-    def to_dataframe(self, data: List[MarketData]) -> pd.DataFrame:
+    def to_dataframe(self, data: Union[List[MarketData], MarketDataBuffer]) -> pd.DataFrame:
         """Convert market data to pandas DataFrame.
-        
+
         Args:
-            data: Market data
-            
+            data: Market data bars, or a columnar MarketDataBuffer
+
         Returns:
             DataFrame
         """
-        if not data:
+        if not len(data):
             return pd.DataFrame()
-        
-        records = []
-        for md in data:
-            records.append({
-                'timestamp': md.timestamp,
-                'open': md.open,
-                'high': md.high,
-                'low': md.low,
-                'close': md.close,
-                'volume': md.volume
-            })
-        
-        df = pd.DataFrame(records)
-        df.set_index('timestamp', inplace=True)
+
+        # Identity + length + last bar timestamp is enough to detect a
+        # changed window without hashing every row
+        if isinstance(data, MarketDataBuffer):
+            key = (id(data), len(data), data.timestamps[-1])
+        else:
+            key = (id(data), len(data), data[-1].timestamp)
+        if self._df_cache is not None and self._df_cache[0] == key:
+            return self._df_cache[1]
+
+        if isinstance(data, MarketDataBuffer):
+            # Columns already exist as contiguous float64 arrays; wrap
+            # them without copying
+            df = pd.DataFrame(
+                {
+                    'open': data.open,
+                    'high': data.high,
+                    'low': data.low,
+                    'close': data.close,
+                    'volume': data.volume,
+                },
+                index=pd.DatetimeIndex(data.timestamps, name='timestamp'),
+                copy=False,
+            )
+        else:
+            # Build typed columns directly instead of a dict per bar: skips
+            # N dict allocations and pandas' row-wise type inference
+            n = len(data)
+            df = pd.DataFrame(
+                {
+                    'open': np.fromiter((md.open for md in data), dtype=np.float64, count=n),
+                    'high': np.fromiter((md.high for md in data), dtype=np.float64, count=n),
+                    'low': np.fromiter((md.low for md in data), dtype=np.float64, count=n),
+                    'close': np.fromiter((md.close for md in data), dtype=np.float64, count=n),
+                    'volume': np.fromiter((md.volume for md in data), dtype=np.float64, count=n),
+                },
+                index=pd.DatetimeIndex([md.timestamp for md in data], name='timestamp'),
+            )
+        self._df_cache = (key, df)
         return df
\ No newline at end of file
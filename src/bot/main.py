@@ -1,41 +1,91 @@
 """Main entrypoint for the trading bot."""
 
 import asyncio
-import argparse
 import sys
 from pathlib import Path
 
+try:
+    # Drop-in libuv event loop: lower per-coroutine and I/O overhead than
+    # the default selector loop. Optional; absent on Windows.
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from bot.core.config import load_config, TradingBotConfig
-from bot.core.engine import TradingEngine
 from bot.core.logger import setup_logger, get_logger
 
 
+_MODES = ('dry-run', 'backtest', 'live')
+_LOG_LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR')
+
+_USAGE = """usage: bot.main [-h] [--config CONFIG] [--mode {dry-run,backtest,live}]
+                [--log-level {DEBUG,INFO,WARNING,ERROR}]
+
+Multi-Strategy Trading Bot
+
+options:
+  -h, --help       show this help message and exit
+  --config CONFIG  Path to configuration file
+  --mode           Trading mode (overrides config)
+  --log-level      Log level (overrides config)"""
+
+
+class _Args:
+    """Parsed command-line options."""
+
+    __slots__ = ('config', 'mode', 'log_level')
+
+    def __init__(self):
+        self.config = 'config.yaml'
+        self.mode = None
+        self.log_level = None
+
+
+def _parse_args(argv) -> _Args:
+    """Parse the three known flags by hand.
+
+    argparse costs tens of ms of import and parser construction on every
+    cold start; this loop handles --flag value and --flag=value forms and
+    keeps --help instant.
+    """
+    args = _Args()
+    valid = {'--config': None, '--mode': _MODES, '--log-level': _LOG_LEVELS}
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in ('-h', '--help'):
+            print(_USAGE)
+            sys.exit(0)
+        flag, _, value = arg.partition('=')
+        if flag not in valid:
+            print(f"error: unrecognized argument: {arg}", file=sys.stderr)
+            sys.exit(2)
+        if not value:
+            i += 1
+            if i >= len(argv):
+                print(f"error: argument {flag}: expected one value", file=sys.stderr)
+                sys.exit(2)
+            value = argv[i]
+        choices = valid[flag]
+        if choices is not None and value not in choices:
+            print(
+                f"error: argument {flag}: invalid choice: {value!r} "
+                f"(choose from {', '.join(choices)})",
+                file=sys.stderr,
+            )
+            sys.exit(2)
+        setattr(args, flag[2:].replace('-', '_'), value)
+        i += 1
+    return args
+
+
 async def main():
     """Main function."""
-    parser = argparse.ArgumentParser(description="Multi-Strategy Trading Bot")
-    parser.add_argument(
-        '--config', 
-        type=str, 
-        default='config.yaml',
-        help='Path to configuration file'
-    )
-    parser.add_argument(
-        '--mode',
-        type=str,
-        choices=['dry-run', 'backtest', 'live'],
-        help='Trading mode (overrides config)'
-    )
-    parser.add_argument(
-        '--log-level',
-        type=str,
-        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
-        help='Log level (overrides config)'
-    )
-    args = parser.parse_args()
-    
+    args = _parse_args(sys.argv[1:])
+
     try:
         # Load configuration
         config = load_config(args.config)
@@ -60,8 +110,11 @@ async def main():
         logger.info("Configuration loaded successfully")
         logger.info(f"Trading mode: {config.mode}")
         logger.info(f"Initial capital: ${config.execution.initial_capital:,.2f}")
-        
-        # Create and start trading engine
+
+        # Create and start trading engine. Imported here, after config
+        # parsing and validation, so bad flags or a broken config fail
+        # fast without paying the pandas/numpy/engine import cost.
+        from bot.core.engine import TradingEngine
         engine = TradingEngine(config)
         await engine.start()
         
@@ -80,4 +133,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
\ No newline at end of file
@@ -3,7 +3,41 @@
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
 
-from bot.core.models import Signal, Order, Trade
+from bot.core.models import Signal, Order, Side, Trade
+
+
+# Message templates parsed once at import; _format_* then fills them with
+# format_map instead of re-evaluating a chain of f-string expressions per
+# message. Side strings are pre-uppercased for the same reason.
+_SIDE_UPPER = {side: side.value.upper() for side in Side}
+
+_SIGNAL_TMPL = (
+    "📊 Signal: {strategy}\n"
+    "Symbol: {symbol}\n"
+    "Side: {side}\n"
+    "Price: {price}\n"
+    "Confidence: {confidence}\n"
+    "Type: {type}"
+)
+
+_ORDER_TMPL = (
+    "📝 Order: {id}\n"
+    "Symbol: {symbol}\n"
+    "Side: {side}\n"
+    "Type: {type}\n"
+    "Quantity: {quantity}\n"
+    "Price: {price}\n"
+    "Status: {status}"
+)
+
+_TRADE_TMPL = (
+    "✅ Trade: {id}\n"
+    "Symbol: {symbol}\n"
+    "Side: {side}\n"
+    "Quantity: {quantity}\n"
+    "Price: {price}\n"
+    "Value: ${value}"
+)
 
 
 class NotifierBase(ABC):
@@ -96,14 +130,14 @@ class NotifierBase(ABC):
         Returns:
             Formatted message
         """
-        return (
-            f"📊 Signal: {signal.strategy_name}\n"
-            f"Symbol: {signal.symbol}\n"
-            f"Side: {signal.side.value.upper()}\n"
-            f"Price: {signal.price:.2f}\n"
-            f"Confidence: {signal.confidence:.2%}\n"
-            f"Type: {signal.signal_type.value}"
-        )
+        return _SIGNAL_TMPL.format_map({
+            'strategy': signal.strategy_name,
+            'symbol': signal.symbol,
+            'side': _SIDE_UPPER[signal.side],
+            'price': format(signal.price, '.2f'),
+            'confidence': format(signal.confidence, '.2%'),
+            'type': signal.signal_type.value,
+        })
     
     def _format_order(self, order: Order) -> str:
         """Format order as message.
@@ -114,15 +148,15 @@ class NotifierBase(ABC):
         Returns:
             Formatted message
         """
-        return (
-            f"📝 Order: {order.id}\n"
-            f"Symbol: {order.symbol}\n"
-            f"Side: {order.side.value.upper()}\n"
-            f"Type: {order.order_type.value}\n"
-            f"Quantity: {order.quantity:.4f}\n"
-            f"Price: {order.price:.2f}\n"
-            f"Status: {order.status.value}"
-        )
+        return _ORDER_TMPL.format_map({
+            'id': order.id,
+            'symbol': order.symbol,
+            'side': _SIDE_UPPER[order.side],
+            'type': order.order_type.value,
+            'quantity': format(order.quantity, '.4f'),
+            'price': format(order.price, '.2f'),
+            'status': order.status.value,
+        })
     
     def _format_trade(self, trade: Trade) -> str:
         """Format trade as message.
@@ -133,11 +167,11 @@ class NotifierBase(ABC):
         Returns:
             Formatted message
         """
-        return (
-            f"✅ Trade: {trade.id}\n"
-            f"Symbol: {trade.symbol}\n"
-            f"Side: {trade.side.value.upper()}\n"
-            f"Quantity: {trade.quantity:.4f}\n"
-            f"Price: {trade.price:.2f}\n"
-            f"Value: ${trade.value:.2f}"
-        )
\ No newline at end of file
+        return _TRADE_TMPL.format_map({
+            'id': trade.id,
+            'symbol': trade.symbol,
+            'side': _SIDE_UPPER[trade.side],
+            'quantity': format(trade.quantity, '.4f'),
+            'price': format(trade.price, '.2f'),
+            'value': format(trade.value, '.2f'),
+        })
\ No newline at end of file
@@ -2,13 +2,26 @@
 
 import asyncio
 import smtplib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import Dict, Any
+from functools import partial
+from typing import Dict, Any, Optional
+
+try:
+    # Native asyncio SMTP: no thread hop per send
+    import aiosmtplib
+except ImportError:
+    aiosmtplib = None
 
 from bot.notifiers.base import NotifierBase
 from bot.core.logger import get_logger
 
+# One logger for the module; instances share it instead of re-resolving
+# the same name per construction and per log call
+logger = get_logger("notifiers.email")
+
 
 class EmailNotifier(NotifierBase):
     """Email notification service."""
@@ -16,8 +29,7 @@ class EmailNotifier(NotifierBase):
     def __init__(self, config: Dict[str, Any]):
         """Initialize email notifier."""
         super().__init__(config)
-        self.logger = get_logger("notifiers.email")
-        
+
         email_config = config.get('email', {})
         self.smtp_host = email_config.get('smtp_host', '')
         self.smtp_port = email_config.get('smtp_port', 587)
@@ -26,23 +38,58 @@ class EmailNotifier(NotifierBase):
         self.from_email = email_config.get('from_email', '')
         self.to_email = email_config.get('to_email', '')
         
+        # Dedicated single worker so SMTP sends queue up here instead of
+        # contending with the event loop's default executor
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        # Long-lived SMTP session shared across sends; opened lazily on
+        # the worker thread so the TLS handshake and login are paid once,
+        # not per message
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._smtp_lock = threading.Lock()
+
+        # Async SMTP session used when aiosmtplib is installed; the
+        # threaded smtplib path above remains the fallback
+        self._asmtp = None
+        self._asmtp_lock: Optional[asyncio.Lock] = None
+
         # Disable if credentials missing
         if not all([self.smtp_host, self.username, self.password, self.from_email, self.to_email]):
             self.enabled = False
-            self.logger.warning("Email notifier disabled: missing required credentials")
+            logger.warning("Email notifier disabled: missing required credentials")
     
     async def connect(self) -> None:
         """Connect to SMTP server."""
         if not self.enabled:
-            self.logger.warning("Email notifier is disabled")
+            logger.warning("Email notifier is disabled")
             return
         
-        self.logger.info("Email notifier ready (connection on send)")
+        if aiosmtplib is not None:
+            self._asmtp_lock = asyncio.Lock()
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="email-notifier")
+        logger.info("Email notifier ready (connection on send)")
         self._initialized = True
     
     async def disconnect(self) -> None:
         """Disconnect from SMTP server."""
-        self.logger.info("Email notifier disconnected")
+        if self._asmtp is not None:
+            try:
+                await self._asmtp.quit()
+            except Exception:
+                pass
+            self._asmtp = None
+        with self._smtp_lock:
+            if self._smtp is not None:
+                try:
+                    self._smtp.quit()
+                except Exception:
+                    pass
+                self._smtp = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        logger.info("Email notifier disconnected")
     
     async def send_message(self, message: str, **kwargs) -> bool:
         """Send email message.
@@ -58,25 +105,75 @@ class EmailNotifier(NotifierBase):
             return False
         
         try:
-            # Send email in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, self._send_sync, message, **kwargs)
-            self.logger.info("Email sent successfully")
+            if aiosmtplib is not None:
+                await self._send_async(message, **kwargs)
+            else:
+                # Send email on the dedicated worker thread to avoid blocking
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(
+                    self._executor, partial(self._send_sync, message, **kwargs)
+                )
+            logger.info("Email sent successfully")
             return True
         except Exception as e:
-            self.logger.error(f"Failed to send email: {e}")
+            logger.error(f"Failed to send email: {e}")
             return False
-    
-    def _send_sync(self, message: str, subject: str = "Trading Bot Notification", **kwargs) -> None:
-        """Send email synchronously."""
+
+    def _build_message(self, message: str, subject: str = "Trading Bot Notification", **kwargs) -> MIMEMultipart:
+        """Build the MIME message shared by both send paths."""
         msg = MIMEMultipart()
         msg['From'] = self.from_email
         msg['To'] = self.to_email
         msg['Subject'] = subject
-        
         msg.attach(MIMEText(message, 'plain'))
-        
-        with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
+        return msg
+
+    async def _open_asmtp(self):
+        """Open and authenticate a new async SMTP session."""
+        if self.smtp_port == 465:
+            smtp = aiosmtplib.SMTP(hostname=self.smtp_host, port=self.smtp_port, use_tls=True)
+        else:
+            smtp = aiosmtplib.SMTP(hostname=self.smtp_host, port=self.smtp_port, start_tls=True)
+        await smtp.connect()
+        await smtp.login(self.username, self.password)
+        return smtp
+
+    async def _send_async(self, message: str, **kwargs) -> None:
+        """Send over the persistent aiosmtplib session."""
+        msg = self._build_message(message, **kwargs)
+        if self._asmtp_lock is None:
+            self._asmtp_lock = asyncio.Lock()
+        async with self._asmtp_lock:
+            if self._asmtp is None:
+                self._asmtp = await self._open_asmtp()
+            try:
+                await self._asmtp.send_message(msg)
+            except (aiosmtplib.SMTPException, OSError):
+                # Stale session: reconnect once
+                self._asmtp = await self._open_asmtp()
+                await self._asmtp.send_message(msg)
+    
+    def _open_smtp(self) -> smtplib.SMTP:
+        """Open and authenticate a new SMTP session."""
+        if self.smtp_port == 465:
+            # Implicit TLS: skips the STARTTLS round trip
+            server = smtplib.SMTP_SSL(self.smtp_host, self.smtp_port)
+        else:
+            server = smtplib.SMTP(self.smtp_host, self.smtp_port)
             server.starttls()
-            server.login(self.username, self.password)
-            server.send_message(msg)
\ No newline at end of file
+        server.login(self.username, self.password)
+        return server
+
+    def _send_sync(self, message: str, **kwargs) -> None:
+        """Send email synchronously over the persistent session."""
+        msg = self._build_message(message, **kwargs)
+        
+        with self._smtp_lock:
+            if self._smtp is None:
+                self._smtp = self._open_smtp()
+            try:
+                self._smtp.send_message(msg)
+            except (smtplib.SMTPServerDisconnected, OSError):
+                # Stale session (server idle timeout): reconnect once
+                self._smtp = self._open_smtp()
+                self._smtp.send_message(msg)
\ No newline at end of file
@@ -3,13 +3,56 @@
 import asyncio
 from typing import Dict, Any, Optional
 
-from telegram import Bot
-from telegram.error import TelegramError
-
 from bot.notifiers.base import NotifierBase
 from bot.core.logger import get_logger
 from bot.core.models import Signal
 
+# One logger for the module; instances share it instead of re-resolving
+# the same name per construction and per log call
+logger = get_logger("trading-bot.notifiers.telegram")
+
+# python-telegram-bot is imported lazily on first construction with valid
+# credentials; when the channel is disabled the package (and its HTTP
+# stack) never loads. Exception as the placeholder keeps the except
+# clauses below valid before the real TelegramError is bound.
+Bot = None
+TelegramError = Exception
+
+# HTTP client shared by every Bot instance in this process so reconnects
+# and multiple notifiers reuse one keepalive connection pool
+_request = None
+
+# Messages queued within this window are coalesced into one API call;
+# Telegram caps message text at 4096 characters
+_BATCH_WINDOW_S = 0.25
+_MAX_MESSAGE_LEN = 4096
+_BATCH_SEPARATOR = "\n\n---\n\n"
+
+
+def _import_telegram() -> bool:
+    """Bind Bot/TelegramError from python-telegram-bot on first use."""
+    global Bot, TelegramError
+    if Bot is not None:
+        return True
+    try:
+        from telegram import Bot as _Bot
+        from telegram.error import TelegramError as _TelegramError
+    except ImportError:
+        return False
+    Bot, TelegramError = _Bot, _TelegramError
+    return True
+
+
+def _shared_request():
+    """Process-wide HTTPXRequest with a keepalive pool, built on first use."""
+    global _request
+    if _request is None:
+        from telegram.request import HTTPXRequest
+        _request = HTTPXRequest(
+            connection_pool_size=8, connect_timeout=5.0, read_timeout=10.0
+        )
+    return _request
+
 
 class TelegramNotifier(NotifierBase):
     """Telegram notification service."""
@@ -18,63 +61,92 @@ class TelegramNotifier(NotifierBase):
         """Initialize Telegram notifier."""
         # NotifierBase may expect a config dict - pass through
         super().__init__(config)
-        self.logger = get_logger("trading-bot.notifiers.telegram")
-        self.bot: Optional[Bot] = None
+        self.bot = None
 
-        telegram_config = {}
-        if isinstance(config, dict):
-            # support either {"telegram": {...}} or raw telegram dict
-            telegram_config = config.get("telegram", config)
+        # Outgoing messages are queued and coalesced by a background
+        # flusher (started in connect) so a burst of signals in one tick
+        # costs one API round trip instead of one per message
+        self._queue: Optional[asyncio.Queue] = None
+        self._flusher: Optional[asyncio.Task] = None
+        # Bound bot.send_message, cached after a successful connect so
+        # the hot send path skips two attribute lookups per call
+        self._send_message = None
 
-        self.bot_token = telegram_config.get("bot_token", "") if telegram_config else ""
-        self.chat_id = telegram_config.get("chat_id", "") if telegram_config else ""
+        # support either {"telegram": {...}} or a raw telegram dict; the
+        # engine always passes a dict, so one lookup settles which
+        tg = config.get("telegram") or config or {}
+        self.bot_token = tg.get("bot_token", "")
+        self.chat_id = tg.get("chat_id", "")
+        # Read once here instead of digging through self.config per signal
+        self._min_conf = config.get("min_confidence_threshold", 0.0)
 
         # CRITICAL: Handle missing credentials gracefully
         # Log warning and disable if token or chat_id is missing
         if not self.bot_token or not self.chat_id:
             self.enabled = False
-            self.logger.warning(
+            logger.warning(
                 "Telegram notifier disabled: missing required credentials. "
                 "Please provide bot_token and chat_id in configuration."
             )
             return
 
+        if not _import_telegram():
+            self.enabled = False
+            logger.warning(
+                "Telegram notifier disabled: python-telegram-bot is not installed"
+            )
+            return
+
         # Initialize bot but don't connect yet
         try:
-            self.bot = Bot(token=self.bot_token)
+            self.bot = Bot(token=self.bot_token, request=_shared_request())
         except Exception as e:
             self.enabled = False
-            self.logger.warning(f"Telegram notifier disabled: failed to initialize bot: {e}")
+            logger.warning(f"Telegram notifier disabled: failed to initialize bot: {e}")
 
     async def connect(self) -> None:
         """Connect to Telegram API."""
         if not getattr(self, "enabled", True):
-            self.logger.info("Telegram notifier is disabled")
+            logger.info("Telegram notifier is disabled")
             return
 
         if self.bot is None:
-            self.logger.warning("Telegram bot not initialized")
+            logger.warning("Telegram bot not initialized")
             self.enabled = False
             return
 
         try:
             # Verify bot by getting bot info
             await self.bot.get_me()
-            self.logger.info("Connected to Telegram successfully")
+            logger.info("Connected to Telegram successfully")
             self._initialized = True
+            self._send_message = self.bot.send_message
+            self._queue = asyncio.Queue()
+            self._flusher = asyncio.create_task(self._flush_loop())
         except TelegramError as e:
             # CRITICAL: Do not crash, just log and disable
-            self.logger.error(f"Failed to connect to Telegram: {e}")
+            logger.error(f"Failed to connect to Telegram: {e}")
             self.enabled = False
-            self.logger.warning("Telegram notifier disabled due to connection error")
+            logger.warning("Telegram notifier disabled due to connection error")
         except Exception as e:
             # CRITICAL: Do not crash, just log and disable
-            self.logger.error(f"Unexpected error connecting to Telegram: {e}")
+            logger.error(f"Unexpected error connecting to Telegram: {e}")
             self.enabled = False
-            self.logger.warning("Telegram notifier disabled due to unexpected error")
+            logger.warning("Telegram notifier disabled due to unexpected error")
 
     async def disconnect(self) -> None:
         """Disconnect from Telegram API."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+            # Flush whatever the cancelled loop left queued
+            if self._queue is not None and not self._queue.empty():
+                await self._send_batch(self._drain_queue())
+            self._queue = None
         # Bot doesn't have a strict disconnect method in some versions; best-effort
         if self.bot:
             try:
@@ -84,8 +156,9 @@ class TelegramNotifier(NotifierBase):
                 elif hasattr(self.bot, "session") and hasattr(self.bot.session, "close"):
                     await self.bot.session.close()
             except Exception as e:
-                self.logger.error(f"Error disconnecting from Telegram: {e}")
-        self.logger.info("Telegram notifier disconnected")
+                logger.error(f"Error disconnecting from Telegram: {e}")
+        self._send_message = None
+        logger.info("Telegram notifier disconnected")
 
     async def send_message(self, message: str, **kwargs) -> bool:
         """Send Telegram message.
@@ -98,43 +171,94 @@ class TelegramNotifier(NotifierBase):
             True if successful, False otherwise
         """
         if not getattr(self, "enabled", False) or self.bot is None:
-            self.logger.debug("Telegram notifier not enabled or bot not initialized - message skipped")
+            logger.debug("Telegram notifier not enabled or bot not initialized - message skipped")
             return False
 
+        # Queue for the coalescing flusher when it is running; messages
+        # arriving within the batch window share one API call
+        if self._queue is not None:
+            self._queue.put_nowait(message)
+            return True
+
         try:
             parse_mode = kwargs.get("parse_mode", "Markdown")
-            await self.bot.send_message(chat_id=self.chat_id, text=message, parse_mode=parse_mode)
-            self.logger.debug("Telegram message sent successfully")
+            send = self._send_message or self.bot.send_message
+            await send(chat_id=self.chat_id, text=message, parse_mode=parse_mode)
+            logger.debug("Telegram message sent successfully")
             return True
         except TelegramError as e:
-            self.logger.error(f"Failed to send Telegram message: {e}")
+            logger.error(f"Failed to send Telegram message: {e}")
             return False
         except Exception as e:
-            self.logger.error(f"Unexpected error sending Telegram message: {e}")
+            logger.error(f"Unexpected error sending Telegram message: {e}")
             return False
 
+    def _drain_queue(self) -> list:
+        """Pull every message currently sitting in the queue."""
+        batch = []
+        while not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _send_batch(self, batch: list) -> None:
+        """Send a list of queued messages as one Telegram message."""
+        if not batch:
+            return
+        text = _BATCH_SEPARATOR.join(batch)
+        if len(text) > _MAX_MESSAGE_LEN:
+            text = text[:_MAX_MESSAGE_LEN]
+        try:
+            await self._send_message(chat_id=self.chat_id, text=text, parse_mode="Markdown")
+            logger.debug("Telegram batch of %d message(s) sent", len(batch))
+        except TelegramError as e:
+            logger.error(f"Failed to send Telegram message: {e}")
+        except Exception as e:
+            logger.error(f"Unexpected error sending Telegram message: {e}")
+
+    async def _flush_loop(self) -> None:
+        """Coalesce queued messages within a short window and send once."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + _BATCH_WINDOW_S
+            try:
+                while True:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # Cancelled mid-window (disconnect): don't drop what we
+                # already pulled off the queue
+                await self._send_batch(batch)
+                raise
+            await self._send_batch(batch)
+
     async def notify_signal(self, signal: Signal) -> bool:
         """High-level helper to format and send a signal notification."""
         try:
-            asset = getattr(signal, "asset", "UNKNOWN")
-            confidence = getattr(signal, "confidence_score", getattr(signal, "confidence", 0.0))
-            strategy = getattr(signal, "strategy_source", getattr(signal, "strategy_name", "unknown"))
-            entry = getattr(signal, "entry_price", getattr(signal, "price", None))
-
-            emoji = "🟢" if getattr(signal, "side", None) and getattr(signal.side, "value", "") == "buy" else "🔴"
-            status = "ACCEPTED" if confidence >= getattr(getattr(self, "config", {}), "get", lambda k, d=None: d)("min_confidence_threshold", 0.0) else "LOW_CONFIDENCE"
-
-            message = (
-                f"{emoji} *Trading Signal*\n\n"
-                f"*Asset:* {asset}\n"
-                f"*Side:* {getattr(signal.side, 'value', 'N/A').upper()}\n"
-                f"*Strategy:* {strategy}\n"
-                f"*Entry:* {entry if entry is not None else 'N/A'}\n"
-                f"*Confidence:* {confidence:.2%}\n"
-                f"*Status:* {status}"
-            )
+            confidence = signal.confidence
+            entry = signal.price
+            side_val = signal.side.value
+
+            emoji = "🟢" if side_val == "buy" else "🔴"
+            status = "ACCEPTED" if confidence >= self._min_conf else "LOW_CONFIDENCE"
+
+            message = "\n".join((
+                f"{emoji} *Trading Signal*",
+                "",
+                f"*Asset:* {signal.symbol}",
+                f"*Side:* {side_val.upper()}",
+                f"*Strategy:* {signal.strategy_name}",
+                f"*Entry:* {entry if entry is not None else 'N/A'}",
+                f"*Confidence:* {format(confidence, '.2%')}",
+                f"*Status:* {status}",
+            ))
 
             return await self.send_message(message, parse_mode="Markdown")
         except Exception as e:
-            self.logger.error(f"Error formatting/sending signal notification: {e}")
+            logger.error(f"Error formatting/sending signal notification: {e}")
             return False
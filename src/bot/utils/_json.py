@@ -0,0 +1,30 @@
+"""Optional orjson support.
+
+Exposes ``dumps`` returning UTF-8 bytes, backed by the Rust orjson
+serializer when installed or stdlib json otherwise, so callers can build
+a notification payload once and reuse it across notifiers.
+"""
+
+try:
+    import orjson
+    HAVE_ORJSON = True
+
+    def dumps(obj) -> bytes:
+        """Serialize obj to JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    def loads(data):
+        """Parse JSON from bytes or str."""
+        return orjson.loads(data)
+
+except ImportError:
+    import json
+    HAVE_ORJSON = False
+
+    def dumps(obj) -> bytes:
+        """Serialize obj to JSON bytes."""
+        return json.dumps(obj, default=str).encode()
+
+    def loads(data):
+        """Parse JSON from bytes or str."""
+        return json.loads(data)
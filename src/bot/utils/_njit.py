@@ -0,0 +1,21 @@
+"""Optional numba JIT support.
+
+Exposes `njit` as the real numba decorator when numba is installed, or a
+no-op passthrough otherwise, so numeric kernels can be written once and
+still run (slower) without the optional dependency.
+"""
+
+try:
+    from numba import njit  # noqa: F401
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op replacement for numba.njit."""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap